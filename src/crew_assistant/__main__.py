@@ -5,9 +5,6 @@ import argparse
 import os
 import sys
 
-from .core import create_crew_engine
-from .ui import interactive_provider_setup, run_enhanced_ux_shell
-
 
 def main():
     """Main entry point with argument parsing."""
@@ -30,6 +27,10 @@ Examples:
 
     args = parser.parse_args()
 
+    # Imported after argument parsing: the engine and shell pull in every
+    # agent and provider module, which --help and bad arguments don't need
+    from .ui.setup import interactive_provider_setup
+
     # Provider and model setup
     if args.setup:
         result = interactive_provider_setup()
@@ -53,6 +54,8 @@ Examples:
             print("Run: python main.py --setup")
             return
 
+        from .core import create_crew_engine
+
         try:
             engine = create_crew_engine(provider=provider, model=model, verbose=args.verbose)
 
@@ -98,6 +101,8 @@ Examples:
     print(f"🤖 Using: {provider}/{model}")
     print()
 
+    from .ui.shell import run_enhanced_ux_shell
+
     run_enhanced_ux_shell(provider=provider, model=model)
 
 
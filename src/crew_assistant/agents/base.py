@@ -1,6 +1,8 @@
 # Agent Base Classes
 # Adapted from basic-agent project for crew coordination
 
+import asyncio
+import time
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from typing import Any
@@ -98,58 +100,90 @@ class BaseAgent(ABC):
 
     def execute_task(self, context: TaskContext) -> AgentResult:
         """Execute a task with given context."""
-        import time
-
-        start_time = time.time()
+        start_time = time.perf_counter()
 
         try:
-            # Build messages
-            messages = []
-
-            # Add system prompt
-            system_prompt = self.get_system_prompt()
-            messages.append(ChatMessage(role="system", content=system_prompt))
-
-            # Add task context as user message
-            task_prompt = context.to_prompt()
-            messages.append(ChatMessage(role="user", content=task_prompt))
-
             # Execute via provider
             response = self.provider.chat(
-                messages=messages,
+                messages=self._build_messages(context),
                 model=self.model,
                 max_tokens=self.config.max_tokens,
                 temperature=self.config.temperature,
             )
+            return self._task_result(response, start_time)
 
-            execution_time = time.time() - start_time
-            self.execution_count += 1
+        except Exception as e:
+            return self._task_failure(e, start_time)
 
-            if self.config.verbose:
-                print(f"🤖 {self.config.role} completed task in {execution_time:.2f}s")
+    @property
+    def native_async(self) -> bool:
+        """Whether execute_task_async() awaits the provider without a worker thread."""
+        return (
+            type(self).execute_task is BaseAgent.execute_task
+            and type(self.provider).chat_async is not BaseProvider.chat_async
+        )
+
+    async def execute_task_async(self, context: TaskContext) -> AgentResult:
+        """Execute a task without tying up a thread while the model generates.
+
+        Uses the provider's native async chat. Agents that override
+        execute_task(), or whose provider has no native async chat, run
+        execute_task() on a worker thread instead, so both entry points
+        behave the same.
+        """
+        if not self.native_async:
+            return await asyncio.to_thread(self.execute_task, context)
+
+        start_time = time.perf_counter()
 
-            return AgentResult(
-                content=response.content,
-                agent_role=self.config.role,
-                execution_time=execution_time,
-                tokens_used=response.tokens_used,
-                success=True,
+        try:
+            response = await self.provider.chat_async(
+                messages=self._build_messages(context),
+                model=self.model,
+                max_tokens=self.config.max_tokens,
+                temperature=self.config.temperature,
             )
+            return self._task_result(response, start_time)
 
         except Exception as e:
-            execution_time = time.time() - start_time
-            error_msg = f"Agent {self.config.role} failed: {str(e)}"
-
-            if self.config.verbose:
-                print(f"❌ {error_msg}")
-
-            return AgentResult(
-                content="",
-                agent_role=self.config.role,
-                execution_time=execution_time,
-                success=False,
-                error_message=error_msg,
-            )
+            return self._task_failure(e, start_time)
+
+    def _build_messages(self, context: TaskContext) -> list[ChatMessage]:
+        """System prompt followed by the task context as the user message."""
+        return [
+            ChatMessage(role="system", content=self.get_system_prompt()),
+            ChatMessage(role="user", content=context.to_prompt()),
+        ]
+
+    def _task_result(self, response: Any, start_time: float) -> AgentResult:
+        execution_time = time.perf_counter() - start_time
+        self.execution_count += 1
+
+        if self.config.verbose:
+            print(f"🤖 {self.config.role} completed task in {execution_time:.2f}s")
+
+        return AgentResult(
+            content=response.content,
+            agent_role=self.config.role,
+            execution_time=execution_time,
+            tokens_used=response.tokens_used,
+            success=True,
+        )
+
+    def _task_failure(self, error: Exception, start_time: float) -> AgentResult:
+        execution_time = time.perf_counter() - start_time
+        error_msg = f"Agent {self.config.role} failed: {str(error)}"
+
+        if self.config.verbose:
+            print(f"❌ {error_msg}")
+
+        return AgentResult(
+            content="",
+            agent_role=self.config.role,
+            execution_time=execution_time,
+            success=False,
+            error_message=error_msg,
+        )
 
     @property
     def role(self) -> str:
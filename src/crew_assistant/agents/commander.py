@@ -64,7 +64,7 @@ Be thorough but constructive. Focus on helping the team deliver high-quality res
         """Execute a commander task with review and evaluation."""
         import time
 
-        start_time = time.time()
+        start_time = time.perf_counter()
 
         try:
             # Build the full prompt
@@ -84,7 +84,7 @@ Be thorough but constructive. Focus on helping the team deliver high-quality res
                 temperature=self.config.temperature,
             )
 
-            execution_time = time.time() - start_time
+            execution_time = time.perf_counter() - start_time
             self.execution_count += 1
 
             return AgentResult(
@@ -96,7 +96,7 @@ Be thorough but constructive. Focus on helping the team deliver high-quality res
             )
 
         except Exception as e:
-            execution_time = time.time() - start_time
+            execution_time = time.perf_counter() - start_time
             error_message = f"Commander execution failed: {str(e)}"
 
             return AgentResult(
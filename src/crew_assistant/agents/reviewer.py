@@ -88,7 +88,7 @@ Be thorough but constructive. Always provide numeric ratings for data collection
         """Execute a review task with quality validation."""
         import time
 
-        start_time = time.time()
+        start_time = time.perf_counter()
 
         try:
             # Build the full prompt
@@ -115,7 +115,7 @@ Be thorough but constructive. Always provide numeric ratings for data collection
                 temperature=self.config.temperature,
             )
 
-            execution_time = time.time() - start_time
+            execution_time = time.perf_counter() - start_time
             self.execution_count += 1
 
             return AgentResult(
@@ -127,7 +127,7 @@ Be thorough but constructive. Always provide numeric ratings for data collection
             )
 
         except Exception as e:
-            execution_time = time.time() - start_time
+            execution_time = time.perf_counter() - start_time
             error_message = f"Reviewer execution failed: {str(e)}"
 
             return AgentResult(
@@ -70,7 +70,7 @@ For simple questions, conversations, and basic assistance, respond directly."""
         """Execute a UX task with conversation and delegation logic."""
         import time
 
-        start_time = time.time()
+        start_time = time.perf_counter()
 
         try:
             # Build the full prompt
@@ -90,7 +90,7 @@ For simple questions, conversations, and basic assistance, respond directly."""
                 temperature=self.config.temperature,
             )
 
-            execution_time = time.time() - start_time
+            execution_time = time.perf_counter() - start_time
             self.execution_count += 1
 
             return AgentResult(
@@ -102,7 +102,7 @@ For simple questions, conversations, and basic assistance, respond directly."""
             )
 
         except Exception as e:
-            execution_time = time.time() - start_time
+            execution_time = time.perf_counter() - start_time
             error_message = f"UX execution failed: {str(e)}"
 
             return AgentResult(
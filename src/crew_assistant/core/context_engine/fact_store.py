@@ -3,6 +3,11 @@
 import json
 import os
 
+try:
+    from ...utils.fast_json import dumps
+except ImportError:
+    from utils.fast_json import dumps  # For standalone execution
+
 FACTS_DIR = "memory/facts"
 os.makedirs(FACTS_DIR, exist_ok=True)
 
@@ -12,28 +17,39 @@ FACT_FILE = os.path.join(FACTS_DIR, "user_facts.json")
 class FactStore:
     def __init__(self) -> None:
         self.facts: dict[str, str] = {}
+        # Rendered as_text() output; every change goes through save()
+        self._text: str | None = None
         self._load()
 
     def _load(self):
         if os.path.isfile(FACT_FILE):
-            with open(FACT_FILE) as f:
+            with open(FACT_FILE, "rb") as f:
                 self.facts = json.load(f)
 
     def save(self):
-        with open(FACT_FILE, "w") as f:
-            json.dump(self.facts, f, indent=2)
+        self._text = None
+        with open(FACT_FILE, "wb") as f:
+            f.write(dumps(self.facts))
 
     def set(self, key: str, value: str):
         self.facts[key] = value
         self.save()
 
+    def update(self, facts: dict[str, str]):
+        """Set several facts with a single save."""
+        self.facts.update(facts)
+        self.save()
+
     def get(self, key: str) -> str:
         return self.facts.get(key, "")
 
     def as_text(self) -> str:
-        if not self.facts:
-            return "(no known facts)"
-        return "\n".join([f"- {k}: {v}" for k, v in self.facts.items()])
+        if self._text is None:
+            if not self.facts:
+                self._text = "(no known facts)"
+            else:
+                self._text = "\n".join([f"- {k}: {v}" for k, v in self.facts.items()])
+        return self._text
 
     def all(self) -> dict[str, str]:
         return self.facts
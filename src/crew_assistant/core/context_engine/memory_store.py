@@ -1,10 +1,15 @@
 # === memory_store.py ===
-import json
+import heapq
 import os
 import uuid
 from datetime import datetime
 from typing import Any
 
+try:
+    from ...utils.fast_json import dumps, loads
+except ImportError:
+    from utils.fast_json import dumps, loads  # For standalone execution
+
 MEMORY_DIR = "memory/memory_store"
 os.makedirs(MEMORY_DIR, exist_ok=True)
 
@@ -31,8 +36,9 @@ class MemoryStore:
         safe_ts = memory_entry["timestamp"].replace(":", "-")
         filename = f"{safe_ts}__{agent}.json"
 
-        with open(os.path.join(MEMORY_DIR, filename), "w") as f:
-            json.dump(memory_entry, f, indent=2)
+        # Compact, and encoded by orjson when it is available
+        with open(os.path.join(MEMORY_DIR, filename), "wb") as f:
+            f.write(dumps(memory_entry))
 
     def load_all(self) -> list[dict]:
         """
@@ -44,12 +50,21 @@ class MemoryStore:
         """
         Returns the N most recent memory entries, optionally filtered by agent.
         """
+        # Files are named "<timestamp>__<agent>.json", so entries from other
+        # agents are skipped by name without being opened
+        suffix = f"__{agent}.json" if agent is not None else ""
+        with os.scandir(MEMORY_DIR) as it:
+            candidates = [
+                dir_entry
+                for dir_entry in it
+                if dir_entry.name.endswith(suffix) and dir_entry.is_file()
+            ]
+
         entries = []
-        files = sorted(os.listdir(MEMORY_DIR), reverse=True)
-        for f in files:
+        for dir_entry in _newest_first(candidates, count):
             try:
-                with open(os.path.join(MEMORY_DIR, f)) as file:
-                    entry = json.load(file)
+                with open(dir_entry.path, "rb") as file:
+                    entry = loads(file.read())
                     if agent is None or entry.get("agent") == agent:
                         entries.append(entry)
             except Exception:
@@ -57,3 +72,19 @@ class MemoryStore:
             if len(entries) >= count:
                 break
         return entries
+
+
+def _newest_first(candidates: list[os.DirEntry], count: int):
+    """
+    Yield directory entries newest first (by timestamped name).
+
+    Only the newest `count` are ordered up front; the rest of the listing is
+    sorted only if the caller has to skip some of those and keeps reading.
+    """
+
+    def by_name(dir_entry):
+        return dir_entry.name
+
+    yield from heapq.nlargest(count, candidates, key=by_name)
+    if len(candidates) > count:
+        yield from sorted(candidates, key=by_name, reverse=True)[count:]
@@ -9,6 +9,7 @@ Location: core/context_engine/
 """
 
 import datetime
+import io
 import json
 import os
 import uuid
@@ -31,6 +32,8 @@ class SummaryQueue:
         self.queue: list[dict] = []
         self.flush_limit = flush_limit
         self.on_flush = on_flush
+        # Outputs being streamed in piece by piece, keyed by (source, task_id)
+        self._streams: dict[tuple[str, str], io.StringIO] = {}
 
     def add(self, content: str, source: str, metadata: dict | None = None):
         """
@@ -41,25 +44,56 @@ class SummaryQueue:
             source (str): Origin identifier (e.g., "DevAgent", "task123").
             metadata (dict, optional): Additional metadata for context or tracing.
         """
-        entry = {
-            "id": str(uuid.uuid4()),
-            "timestamp": datetime.datetime.utcnow().isoformat(),
-            "source": source,
-            "content": content.strip(),
-            "metadata": metadata or {},
-        }
-        self.queue.append(entry)
+        self.queue.append(self._entry(content, source, metadata))
 
         if len(self.queue) >= self.flush_limit:
             self.flush()
 
+    def append_chunk(self, source: str, task_id: str, chunk: str):
+        """
+        Stream part of a long output into the queue.
+
+        Chunks for the same (source, task_id) accumulate in one buffer, so an
+        agent transcript never has to be collected as a list of lines and
+        joined by the caller.
+
+        Args:
+            source (str): Origin identifier (e.g., "DevAgent").
+            task_id (str): Task the output belongs to.
+            chunk (str): Next piece of the output.
+        """
+        stream = self._streams.get((source, task_id))
+        if stream is None:
+            stream = self._streams[(source, task_id)] = io.StringIO()
+        stream.write(chunk)
+
+    def end_chunks(self, source: str, task_id: str, metadata: dict | None = None):
+        """
+        Finish a streamed output and queue it as a single entry.
+
+        Args:
+            source (str): Origin identifier passed to append_chunk.
+            task_id (str): Task identifier passed to append_chunk.
+            metadata (dict, optional): Additional metadata for the entry.
+        """
+        stream = self._streams.pop((source, task_id), None)
+        if stream is None:
+            return
+        self.add(stream.getvalue(), source, {"task_id": task_id, **(metadata or {})})
+
     def flush(self):
         """
         Flush the queue to disk and optionally to an external callback.
 
         - Writes current queue to a timestamped .jsonl file in memory/summary_queue
         - Calls `on_flush(entries)` if provided
+
+        Streams still open from append_chunk are queued as they stand.
         """
+        for (source, task_id), stream in self._streams.items():
+            self.queue.append(self._entry(stream.getvalue(), source, {"task_id": task_id}))
+        self._streams.clear()
+
         if not self.queue:
             return
 
@@ -83,6 +117,15 @@ class SummaryQueue:
             except Exception as e:
                 print(f"⚠️  on_flush callback raised exception: {e}")
 
+    def _entry(self, content: str, source: str, metadata: dict | None) -> dict:
+        return {
+            "id": str(uuid.uuid4()),
+            "timestamp": datetime.datetime.utcnow().isoformat(),
+            "source": source,
+            "content": content.strip(),
+            "metadata": metadata or {},
+        }
+
     def pending(self) -> int:
         """Returns the number of unflushed entries in the queue."""
         return len(self.queue)
@@ -1,19 +1,27 @@
 # Crew Engine
 # Main orchestrator for the enhanced crew system
 
+import atexit
 import datetime
-import json
 import os
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import asdict, dataclass
 from typing import Any
 
 from ..agents import create_crew
 from ..providers import get_provider, list_all_models
+from ..utils.fact_learning import RecentMemory
+from ..utils.fast_json import dumps
 from ..workflows import SequentialWorkflow, WorkflowResult
 
 from .context_engine.memory_store import MemoryStore
 
+# Session files are written off the request path. One worker keeps them in
+# submission order, and pending writes are flushed at interpreter exit.
+_session_writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="session-writer")
+atexit.register(_session_writer.shutdown, wait=True)
+
 
 @dataclass
 class CrewConfig:
@@ -46,6 +54,9 @@ class CrewEngine:
 
         # Initialize memory (if enabled)
         self.memory = MemoryStore() if config.memory_enabled else None
+        # Newest memory entries for task context, read once and then kept
+        # in step with each save instead of rescanning the store per task
+        self.recent_memory = RecentMemory(limit=5) if config.memory_enabled else None
 
         # Session tracking
         self.session_history = []
@@ -82,13 +93,14 @@ class CrewEngine:
         if self.memory and result.success:
             try:
                 self.memory.save("CrewEngine", user_request, result.final_output)
+                self.recent_memory.add("CrewEngine", user_request, result.final_output)
             except Exception as e:
                 if self.config.verbose:
                     print(f"⚠️ Memory storage failed: {e}")
 
         # Save session
         if self.config.save_sessions:
-            self._save_session(user_request, result)
+            _session_writer.submit(self._save_session, user_request, result)
 
         # Track in history
         self.session_history.append(
@@ -121,15 +133,9 @@ class CrewEngine:
         else:
             return {}
 
-    def _build_memory_context(self, limit: int = 5) -> str:
+    def _build_memory_context(self) -> str:
         """Build context from recent memory entries."""
-        try:
-            # Use existing memory context building from fact_learning
-            from utils.fact_learning import build_memory_context
-
-            return build_memory_context(limit=limit)
-        except Exception:
-            return ""
+        return self.recent_memory.text()
 
     def _save_session(self, user_request: str, result: WorkflowResult):
         """Save session data to file."""
@@ -139,10 +145,10 @@ class CrewEngine:
             os.makedirs(session_dir, exist_ok=True)
 
             # Create session data
-            timestamp = datetime.datetime.now().strftime("%Y-%m-%dT%H-%M-%S")
+            saved_at = datetime.datetime.now()
             session_data = {
                 "session_id": self.session_id,
-                "timestamp": datetime.datetime.now().isoformat(),
+                "timestamp": saved_at.isoformat(),
                 "config": asdict(self.config),
                 "request": user_request,
                 "result": {
@@ -183,11 +189,13 @@ class CrewEngine:
             }
 
             # Save to file
-            filename = f"{timestamp}__crew_session__{self.session_id}.json"
+            filename = f"{saved_at:%Y-%m-%dT%H-%M-%S}__crew_session__{self.session_id}.json"
             filepath = os.path.join(session_dir, filename)
 
-            with open(filepath, "w") as f:
-                json.dump(session_data, f, indent=2)
+            # Compact, and through orjson when available: session files are
+            # read by tools, and step outputs can make them large
+            with open(filepath, "wb") as f:
+                f.write(dumps(session_data))
 
             if self.config.verbose:
                 print(f"📝 Session saved: {filepath}")
@@ -4,6 +4,7 @@
 import asyncio
 import time
 from abc import ABC, abstractmethod
+from collections.abc import AsyncGenerator
 from dataclasses import dataclass, field
 from typing import Any, AsyncIterator, Callable, Dict, List, Optional
 from urllib.parse import urlparse
@@ -126,6 +127,10 @@ class BaseProvider(ABC):
         self._circuit_breaker_open = False
         self._response_cache: Dict[str, Any] = {}
         self._cache_ttl = config.get("cache_ttl", 300)  # 5 minutes
+        self._models_cache: tuple[float, list[ModelInfo]] | None = None
+        self._models_cache_ttl = config.get("models_cache_ttl", 5.0)
+        # Closes the current async client when its event loop shuts down
+        self._async_client_closer: AsyncGenerator[None, None] | None = None
 
         logger.info(
             f"Initialized {self.display_name} provider with config: timeout={self.timeout}s, retries={self.max_retries}"
@@ -138,8 +143,7 @@ class BaseProvider(ABC):
 
     async def chat_async(self, messages: list[ChatMessage], model: str, **kwargs) -> ChatResponse:
         """Async version of chat (default implementation runs sync in thread)."""
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.chat, messages, model, **kwargs)
+        return await asyncio.to_thread(self.chat, messages, model, **kwargs)
 
     def chat_streaming(
         self, messages: list[ChatMessage], model: str, **kwargs
@@ -230,6 +234,18 @@ class BaseProvider(ABC):
         """Get list of available models."""
         pass
 
+    def list_models_cached(self) -> list[ModelInfo]:
+        """Get list of available models, reusing a recent listing within the TTL window."""
+        now = time.monotonic()
+        if self._models_cache is not None:
+            fetched_at, models = self._models_cache
+            if now - fetched_at < self._models_cache_ttl:
+                return models
+
+        models = self.list_models()
+        self._models_cache = (now, models)
+        return models
+
     @abstractmethod
     def test_connection(self) -> bool:
         """Test if provider is available and responding."""
@@ -317,8 +333,20 @@ class BaseProvider(ABC):
         """Clear response cache."""
         cleared_count = len(self._response_cache)
         self._response_cache.clear()
+        self._models_cache = None
         logger.info(f"Cleared {cleared_count} cached responses for {self.name} provider")
 
+    async def _close_with_running_loop(self, client: Any) -> None:
+        """Have client closed on the running event loop when that loop shuts down.
+
+        asyncio.run() closes open async generators before it closes its
+        loop, so a generator suspended in try/finally closes the client while
+        its connections can still be shut down. Replacing the generator hands
+        the previous one to its own loop to close.
+        """
+        self._async_client_closer = _aclose_on_shutdown(client)
+        await anext(self._async_client_closer)
+
     def _generate_cache_key(self, messages: list[ChatMessage], model: str, kwargs: dict) -> str:
         """Generate cache key for request."""
         import hashlib
@@ -327,6 +355,15 @@ class BaseProvider(ABC):
         cache_params = f"{model}:{content}:{sorted(kwargs.items())}"
         return hashlib.md5(cache_params.encode()).hexdigest()
 
+    @staticmethod
+    def _response_snippet(response: Any, limit: int = 512) -> str:
+        """Leading bytes of a response body for log messages.
+
+        Avoids response.text, which decodes (and may charset-sniff) the whole
+        body even when the server returned a large HTML error page.
+        """
+        return response.content[:limit].decode("utf-8", errors="replace")
+
     def _is_circuit_breaker_open(self) -> bool:
         """Check if circuit breaker is open."""
         if not self._circuit_breaker_open:
@@ -373,6 +410,14 @@ class BaseProvider(ABC):
             self.health.consecutive_failures = 0
 
 
+async def _aclose_on_shutdown(client: Any) -> AsyncGenerator[None, None]:
+    """Suspend until closed, then close client."""
+    try:
+        yield
+    finally:
+        await client.aclose()
+
+
 class ProviderError(Exception):
     """Base exception for provider-related errors."""
 
@@ -3,6 +3,7 @@
 
 import asyncio
 import json
+import re
 import time
 from typing import Any, AsyncIterator, Dict, List, Optional
 from urllib.parse import urljoin
@@ -22,6 +23,9 @@ from .base import (
     ProviderTimeoutError,
 )
 
+# Context length advertised in a model's metadata, e.g. "32k context"
+_CONTEXT_LENGTH_RE = re.compile(r"(?P<size>\d+)(?P<kilo>k?)\s*(?:context|ctx)", re.IGNORECASE)
+
 
 class LMStudioProvider(BaseProvider):
     """Production LM Studio AI provider with connection pooling and streaming."""
@@ -58,7 +62,9 @@ class LMStudioProvider(BaseProvider):
         self._sync_client.mount("https://", adapter)
 
         # Async client for streaming and async operations
-        self._async_client: Optional[httpx.AsyncClient] = None
+        self._async_client: httpx.AsyncClient | None = None
+        # Pooled connections belong to the event loop that opened them
+        self._async_loop: asyncio.AbstractEventLoop | None = None
 
         logger.info(f"LM Studio provider initialized with pool size {self.connection_pool_size}")
 
@@ -131,7 +137,7 @@ class LMStudioProvider(BaseProvider):
             raise ProviderTimeoutError(f"LM Studio request timed out after {self.timeout}s")
         except requests.exceptions.HTTPError as e:
             logger.error(
-                f"[{request_id}] LM Studio HTTP error: {e.response.status_code} - {e.response.text if e.response else 'No response'}"
+                f"[{request_id}] LM Studio HTTP error: {e.response.status_code} - {self._response_snippet(e.response) if e.response else 'No response'}"
             )
             if e.response and e.response.status_code == 404:
                 raise ModelNotFoundError(f"Model '{model}' not found in LM Studio")
@@ -145,10 +151,15 @@ class LMStudioProvider(BaseProvider):
             logger.error(f"[{request_id}] Unexpected LM Studio error: {e}")
             raise ConnectionError(f"LM Studio error: {e}")
 
-    async def chat_async(self, messages: list[ChatMessage], model: str, **kwargs) -> ChatResponse:
-        """Async chat with LM Studio using connection pooling."""
-        if not self._async_client:
-            self._async_client = httpx.AsyncClient(
+    async def _get_async_client(self) -> httpx.AsyncClient:
+        """Return the pooled async client for the running event loop.
+
+        Pooled connections belong to the loop that opened them, so a new
+        loop gets a new client and the previous one is closed on its own loop.
+        """
+        loop = asyncio.get_running_loop()
+        if self._async_client is None or self._async_loop is not loop:
+            client = httpx.AsyncClient(
                 timeout=httpx.Timeout(self.timeout),
                 limits=httpx.Limits(
                     max_keepalive_connections=self.connection_pool_size,
@@ -161,6 +172,14 @@ class LMStudioProvider(BaseProvider):
                     "User-Agent": "CrewAssistant/1.0.0 (LMStudio Provider Async)",
                 },
             )
+            await self._close_with_running_loop(client)
+            self._async_client = client
+            self._async_loop = loop
+        return self._async_client
+
+    async def chat_async(self, messages: list[ChatMessage], model: str, **kwargs) -> ChatResponse:
+        """Async chat with LM Studio using connection pooling."""
+        client = await self._get_async_client()
 
         start_time = time.time()
 
@@ -185,9 +204,7 @@ class LMStudioProvider(BaseProvider):
         request_id = f"lms_async_{int(time.time() * 1000)}_{hash(str(payload)) % 10000}"
 
         try:
-            response = await self._async_client.post(
-                f"{self.base_url}/chat/completions", json=payload
-            )
+            response = await client.post(f"{self.base_url}/chat/completions", json=payload)
             response.raise_for_status()
 
             result = response.json()
@@ -224,14 +241,7 @@ class LMStudioProvider(BaseProvider):
         self, messages: list[ChatMessage], model: str, **kwargs
     ) -> AsyncIterator[ChatChunk]:
         """Stream chat response from LM Studio."""
-        if not self._async_client:
-            self._async_client = httpx.AsyncClient(
-                timeout=httpx.Timeout(self.stream_timeout),
-                limits=httpx.Limits(
-                    max_keepalive_connections=self.connection_pool_size,
-                    max_connections=self.connection_pool_size * 2,
-                ),
-            )
+        client = await self._get_async_client()
 
         openai_messages = [{"role": msg.role, "content": msg.content} for msg in messages]
 
@@ -248,11 +258,11 @@ class LMStudioProvider(BaseProvider):
         logger.debug(f"[{request_id}] Starting streaming request")
 
         try:
-            async with self._async_client.stream(
+            async with client.stream(
                 "POST",
                 f"{self.base_url}/chat/completions",
                 json=payload,
-                headers={"Authorization": f"Bearer {self.api_key}"},
+                timeout=self.stream_timeout,
             ) as response:
                 response.raise_for_status()
 
@@ -305,15 +315,12 @@ class LMStudioProvider(BaseProvider):
 
                 # Extract additional metadata
                 context_length = None
-                if "context" in str(model).lower():
-                    # Try to extract context length from model name/description
-                    import re
-
-                    context_match = re.search(r"(\d+)k?\s*(?:context|ctx)", str(model).lower())
-                    if context_match:
-                        context_length = int(context_match.group(1))
-                        if "k" in context_match.group(0).lower():
-                            context_length *= 1000
+                # Try to extract context length from model name/description
+                context_match = _CONTEXT_LENGTH_RE.search(str(model))
+                if context_match:
+                    context_length = int(context_match.group("size"))
+                    if context_match.group("kilo"):
+                        context_length *= 1000
 
                 # Determine compatibility and capabilities
                 compatibility = self._categorize_compatibility(model_id)
@@ -362,7 +369,7 @@ class LMStudioProvider(BaseProvider):
                 logger.debug(f"LM Studio health check passed: {response.status_code}")
             else:
                 logger.warning(
-                    f"LM Studio health check failed: {response.status_code} - {response.text}"
+                    f"LM Studio health check failed: {response.status_code} - {self._response_snippet(response)}"
                 )
 
             return is_healthy
@@ -467,7 +474,15 @@ class LMStudioProvider(BaseProvider):
             self._sync_client.close()
 
         if self._async_client:
-            asyncio.create_task(self._async_client.aclose())
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                # No loop to close it on; its connections went with the
+                # event loop that opened them
+                loop = None
+            if loop is not None and loop is self._async_loop:
+                loop.create_task(self._async_client.aclose())
+            self._async_client = None
 
     def __del__(self):
         """Cleanup on destruction."""
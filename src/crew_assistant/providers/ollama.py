@@ -21,6 +21,11 @@ from .base import (
     ProviderTimeoutError,
 )
 
+# Read size for streamed pull progress. Ollama reports a download as many
+# short JSON lines; requests' 512-byte default costs a read call for every
+# few of them
+STREAM_READ_SIZE = 64 * 1024
+
 
 class OllamaProvider(BaseProvider):
     """Production Ollama AI provider with native API and streaming support."""
@@ -54,7 +59,9 @@ class OllamaProvider(BaseProvider):
         self._sync_client.mount("https://", adapter)
 
         # Async client for streaming and async operations
-        self._async_client: Optional[httpx.AsyncClient] = None
+        self._async_client: httpx.AsyncClient | None = None
+        # Pooled connections belong to the event loop that opened them
+        self._async_loop: asyncio.AbstractEventLoop | None = None
 
         logger.info(f"Ollama provider initialized with pool size {self.connection_pool_size}")
 
@@ -138,7 +145,7 @@ class OllamaProvider(BaseProvider):
             raise ProviderTimeoutError(f"Ollama request timed out after {self.timeout}s")
         except requests.exceptions.HTTPError as e:
             logger.error(
-                f"[{request_id}] Ollama HTTP error: {e.response.status_code} - {e.response.text if e.response else 'No response'}"
+                f"[{request_id}] Ollama HTTP error: {e.response.status_code} - {self._response_snippet(e.response) if e.response else 'No response'}"
             )
             if e.response and e.response.status_code == 404:
                 # Model might not be pulled yet
@@ -158,10 +165,15 @@ class OllamaProvider(BaseProvider):
             logger.error(f"[{request_id}] Unexpected Ollama error: {e}")
             raise ConnectionError(f"Ollama error: {e}")
 
-    async def chat_async(self, messages: list[ChatMessage], model: str, **kwargs) -> ChatResponse:
-        """Async chat with Ollama using connection pooling."""
-        if not self._async_client:
-            self._async_client = httpx.AsyncClient(
+    async def _get_async_client(self) -> httpx.AsyncClient:
+        """Return the pooled async client for the running event loop.
+
+        Pooled connections belong to the loop that opened them, so a new
+        loop gets a new client and the previous one is closed on its own loop.
+        """
+        loop = asyncio.get_running_loop()
+        if self._async_client is None or self._async_loop is not loop:
+            client = httpx.AsyncClient(
                 timeout=httpx.Timeout(self.timeout),
                 limits=httpx.Limits(
                     max_keepalive_connections=self.connection_pool_size,
@@ -173,6 +185,14 @@ class OllamaProvider(BaseProvider):
                     "User-Agent": "CrewAssistant/1.0.0 (Ollama Provider Async)",
                 },
             )
+            await self._close_with_running_loop(client)
+            self._async_client = client
+            self._async_loop = loop
+        return self._async_client
+
+    async def chat_async(self, messages: list[ChatMessage], model: str, **kwargs) -> ChatResponse:
+        """Async chat with Ollama using connection pooling."""
+        client = await self._get_async_client()
 
         start_time = time.time()
 
@@ -197,7 +217,7 @@ class OllamaProvider(BaseProvider):
         request_id = f"ollama_async_{int(time.time() * 1000)}_{hash(str(payload)) % 10000}"
 
         try:
-            response = await self._async_client.post(f"{self.base_url}/api/chat", json=payload)
+            response = await client.post(f"{self.base_url}/api/chat", json=payload)
             response.raise_for_status()
 
             result = response.json()
@@ -242,14 +262,7 @@ class OllamaProvider(BaseProvider):
         self, messages: list[ChatMessage], model: str, **kwargs
     ) -> AsyncIterator[ChatChunk]:
         """Stream chat response from Ollama."""
-        if not self._async_client:
-            self._async_client = httpx.AsyncClient(
-                timeout=httpx.Timeout(self.stream_timeout),
-                limits=httpx.Limits(
-                    max_keepalive_connections=self.connection_pool_size,
-                    max_connections=self.connection_pool_size * 2,
-                ),
-            )
+        client = await self._get_async_client()
 
         ollama_messages = [{"role": msg.role, "content": msg.content} for msg in messages]
 
@@ -269,8 +282,8 @@ class OllamaProvider(BaseProvider):
         logger.debug(f"[{request_id}] Starting Ollama streaming request")
 
         try:
-            async with self._async_client.stream(
-                "POST", f"{self.base_url}/api/chat", json=payload
+            async with client.stream(
+                "POST", f"{self.base_url}/api/chat", json=payload, timeout=self.stream_timeout
             ) as response:
                 response.raise_for_status()
 
@@ -369,7 +382,7 @@ class OllamaProvider(BaseProvider):
                 logger.debug(f"Ollama health check passed: {response.status_code}")
             else:
                 logger.warning(
-                    f"Ollama health check failed: {response.status_code} - {response.text}"
+                    f"Ollama health check failed: {response.status_code} - {self._response_snippet(response)}"
                 )
 
             return is_healthy
@@ -389,19 +402,23 @@ class OllamaProvider(BaseProvider):
             response.raise_for_status()
 
             # Process streaming response for progress updates
-            for line in response.iter_lines():
-                if line:
-                    try:
-                        data = json.loads(line.decode("utf-8"))
-                        status = data.get("status", "")
-                        if "completed" in status.lower():
-                            logger.info(f"Successfully pulled model {model_name}")
-                            return True
-                        elif "error" in status.lower():
-                            logger.error(f"Error pulling model {model_name}: {status}")
-                            return False
-                    except json.JSONDecodeError:
-                        continue
+            try:
+                for line in response.iter_lines(chunk_size=STREAM_READ_SIZE):
+                    if line:
+                        try:
+                            data = json.loads(line)
+                            status = data.get("status", "")
+                            if "completed" in status.lower():
+                                logger.info(f"Successfully pulled model {model_name}")
+                                return True
+                            elif "error" in status.lower():
+                                logger.error(f"Error pulling model {model_name}: {status}")
+                                return False
+                        except json.JSONDecodeError:
+                            continue
+            finally:
+                # Returning early leaves the stream unread; release the connection
+                response.close()
 
             return True
 
@@ -475,7 +492,15 @@ class OllamaProvider(BaseProvider):
             self._sync_client.close()
 
         if self._async_client:
-            asyncio.create_task(self._async_client.aclose())
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                # No loop to close it on; its connections went with the
+                # event loop that opened them
+                loop = None
+            if loop is not None and loop is self._async_loop:
+                loop.create_task(self._async_client.aclose())
+            self._async_client = None
 
     def __del__(self):
         """Cleanup on destruction."""
@@ -171,7 +171,7 @@ class ProviderRegistry:
                 continue
 
             try:
-                models = provider.list_models()
+                models = provider.list_models_cached()
                 for model in models:
                     if model.id == model_id:
                         # Check if model meets requirements
@@ -199,7 +199,7 @@ class ProviderRegistry:
                 continue
 
             try:
-                models = provider.list_models()
+                models = provider.list_models_cached()
                 for model in models:
                     if self._model_meets_requirements(model, requirements):
                         all_models.append((provider_name, model))
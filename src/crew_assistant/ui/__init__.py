@@ -2,6 +2,15 @@
 # User interfaces for the crew system
 
 from .setup import interactive_provider_setup
-from .shell import run_enhanced_ux_shell
 
 __all__ = ["interactive_provider_setup", "run_enhanced_ux_shell"]
+
+
+def __getattr__(name):
+    # The shell pulls in the crew engine and every agent, provider and
+    # workflow module, so it is only imported once it is actually used
+    if name == "run_enhanced_ux_shell":
+        from .shell import run_enhanced_ux_shell
+
+        return run_enhanced_ux_shell
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
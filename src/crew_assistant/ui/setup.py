@@ -3,7 +3,8 @@
 
 import os
 
-from ..providers import get_provider, list_all_models
+# Display marker for each ModelInfo.compatibility value
+_STATUS_EMOJI = {"compatible": "✅", "incompatible": "❌", "unknown": "❓"}
 
 
 def interactive_provider_setup() -> tuple[str, str, str] | None:
@@ -207,10 +208,12 @@ def select_model_from_provider(provider_name: str) -> tuple[str, str] | None:
     print(f"\n🔍 Fetching available models from {provider_name.title()}...")
 
     # Get provider instance
+    from ..providers import get_provider
+
     provider = get_provider(provider_name)
 
     try:
-        models = provider.list_models()
+        models = provider.list_models_cached()
     except Exception as e:
         print(f"❌ Failed to fetch models: {e}")
         return None
@@ -223,9 +226,7 @@ def select_model_from_provider(provider_name: str) -> tuple[str, str] | None:
     print("─" * 80)
 
     for i, model in enumerate(models):
-        status_emoji = {"compatible": "✅", "incompatible": "❌", "unknown": "❓"}[
-            model.compatibility
-        ]
+        status_emoji = _STATUS_EMOJI[model.compatibility]
         print(f"{i + 1:2d}. {status_emoji} {model.compatibility.title()} {model.id}")
         print(f"    📝 {model.description}")
         if model.size:
@@ -3,8 +3,14 @@
 
 import subprocess
 import sys
+import time
 from typing import Optional
 
+# Each nvidia-smi query is a fork/exec; status reads within this window reuse
+# the last result (including "no GPU")
+GPU_INFO_TTL = 5.0
+_gpu_info_cache: tuple[float, dict | None] | None = None
+
 
 def set_gpu_power_limit(limit_percent: int = 80) -> bool:
     """
@@ -32,22 +38,37 @@ def set_gpu_power_limit(limit_percent: int = 80) -> bool:
         gpu_names = result.stdout.strip().split("\n")
         print(f"🔍 Found {len(gpu_names)} NVIDIA GPU(s): {', '.join(gpu_names)}")
 
-        # Get current power limit
+        # Get current and maximum power limits
         result = subprocess.run(
-            ["nvidia-smi", "--query-gpu=power.max_limit", "--format=csv,noheader,nounits"],
+            [
+                "nvidia-smi",
+                "--query-gpu=power.limit,power.max_limit",
+                "--format=csv,noheader,nounits",
+            ],
             capture_output=True,
             text=True,
             timeout=5,
         )
 
         if result.returncode == 0:
-            current_limits = [float(x.strip()) for x in result.stdout.strip().split("\n")]
+            power_limits = [
+                [float(x.strip()) for x in line.split(",")]
+                for line in result.stdout.strip().split("\n")
+            ]
 
             # Set power limit for each GPU
             success_count = 0
-            for i, (gpu_name, max_power) in enumerate(zip(gpu_names, current_limits)):
+            for i, (gpu_name, (current_power, max_power)) in enumerate(
+                zip(gpu_names, power_limits)
+            ):
                 target_power = max_power * (limit_percent / 100.0)
 
+                # Already throttled to this level: skip the privileged call
+                if int(current_power) == int(target_power):
+                    print(f"✅ GPU {i} ({gpu_name}): Power limit already {int(target_power)}W")
+                    success_count += 1
+                    continue
+
                 try:
                     subprocess.run(
                         ["nvidia-smi", "-i", str(i), "-pl", str(int(target_power))],
@@ -133,6 +154,18 @@ def get_gpu_info() -> Optional[dict]:
     Returns:
         dict: GPU information or None if not available
     """
+    global _gpu_info_cache
+
+    now = time.monotonic()
+    if _gpu_info_cache and now - _gpu_info_cache[0] < GPU_INFO_TTL:
+        return _gpu_info_cache[1]
+
+    gpu_info = _query_gpu_info()
+    _gpu_info_cache = (now, gpu_info)
+    return gpu_info
+
+
+def _query_gpu_info() -> dict | None:
     try:
         result = subprocess.run(
             [
@@ -1,9 +1,36 @@
 # Fact Learning Utilities
 # Extracted from crew_assistant/ux_loop.py
 
+import atexit
 import re
-
-from core.context_engine.fact_store import FactStore
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+
+try:
+    from .fast_json import loads
+except ImportError:
+    from fast_json import loads  # For standalone execution
+
+# Literal phrase each fact pattern starts with. Text containing none of them
+# can't match, so it skips the regex scans and the fact store load entirely.
+FACT_TRIGGERS = ("my name is", "you can call me", "my partner is", "i prefer")
+
+# All fact patterns as one alternation, one named group per fact key, so
+# extraction is a single scan of the text. The lookahead keeps matches
+# zero-width: a greedy capture ("my name is Bob and I prefer tea") doesn't
+# consume a later fact phrase that its own pattern would still find.
+FACT_PATTERN = re.compile(
+    r"(?i)(?=my name is (?P<name>[a-zA-Z ]{2,})"
+    r"|you can call me (?P<aliases>[a-zA-Z ]{2,})"
+    r"|my partner is (?P<partner>[a-zA-Z ]{2,})"
+    r"|i prefer (?P<preference>[a-zA-Z0-9 \-]+))"
+)
+
+# Turn persistence runs off the prompt loop. One worker keeps the fact
+# store's load/modify/save cycles from racing each other, and pending work
+# is flushed at interpreter exit.
+_background = ThreadPoolExecutor(max_workers=1, thread_name_prefix="fact-learning")
+atexit.register(_background.shutdown, wait=True)
 
 
 def learn_fact_if_possible(text, fact_store=None):
@@ -17,57 +44,161 @@ def learn_fact_if_possible(text, fact_store=None):
     Returns:
         dict: Extracted facts {key: value}
     """
+    return learn_facts_batch([text], fact_store)
+
+
+def learn_facts_batch(texts, fact_store=None):
+    """
+    Extract facts from several texts with a single fact store load and save.
+
+    Args:
+        texts (list[str]): Input texts to analyze, in order
+        fact_store (FactStore): Optional fact store instance
+
+    Returns:
+        dict: Extracted facts {key: value}; later texts win on conflicts
+    """
+    candidates = []
+    for text in texts:
+        text_lower = text.lower()
+        if any(trigger in text_lower for trigger in FACT_TRIGGERS):
+            candidates.append(text)
+
+    extracted_facts = {}
+    for text in candidates:
+        extracted_facts.update(_extract_facts(text))
+
+    if not extracted_facts:
+        return {}
+
     if fact_store is None:
+        from core.context_engine.fact_store import FactStore
+
         fact_store = FactStore()
 
-    patterns = {
-        r"(?i)my name is ([a-zA-Z ]{2,})": "name",
-        r"(?i)you can call me ([a-zA-Z ]{2,})": "aliases",
-        r"(?i)my partner is ([a-zA-Z ]{2,})": "partner",
-        r"(?i)i prefer ([a-zA-Z0-9 \-]+)": "preference",
-    }
+    # Facts the store already holds with the same value aren't rewritten
+    changed = {key: value for key, value in extracted_facts.items() if fact_store.get(key) != value}
+    if changed:
+        fact_store.update(changed)
+        for key, value in changed.items():
+            print(f"💾 Learned fact: {key} = {value}")
+
+    return extracted_facts
+
 
+def _extract_facts(text):
     extracted_facts = {}
+    seen_keys = set()
 
-    for pattern, key in patterns.items():
-        match = re.search(pattern, text)
-        if match:
-            value = match.group(1).strip()
-            if key == "preference":
-                key = f"preferred_{value.lower().replace(' ', '_')}"
-                value = "true"
+    for match in FACT_PATTERN.finditer(text):
+        key = match.lastgroup
+        # Like a per-pattern search, only the first match of each fact counts
+        if key in seen_keys:
+            continue
+        seen_keys.add(key)
 
-            fact_store.set(key, value)
-            extracted_facts[key] = value
-            print(f"💾 Learned fact: {key} = {value}")
+        value = match.group(key).strip()
+        if key == "preference":
+            key = f"preferred_{value.lower().replace(' ', '_')}"
+            value = "true"
+
+        extracted_facts[key] = value
 
     return extracted_facts
 
 
-def build_memory_context(memory_dir="memory/memory_store", limit=10):
+def persist_turn_in_background(memory, user_input, reply, task_id=None) -> Future:
     """
-    Build context string from recent memory entries.
+    Save a chat turn to memory and learn facts from it on a background thread.
 
     Args:
-        memory_dir (str): Path to memory store directory
-        limit (int): Max number of recent entries to include
+        memory (MemoryStore): Store the turn is saved to
+        user_input (str): What the user said
+        reply (str): What the assistant answered
+        task_id (str): Optional task id recorded with the memory entry
 
     Returns:
-        str: Formatted memory context
+        Future: Completes once the turn has been persisted
+    """
+    return _background.submit(_persist_turn, memory, user_input, reply, task_id)
+
+
+class RecentMemory:
     """
-    import json
+    Rolling window of the newest memory entries, formatted for prompts.
+
+    The memory store is scanned once, on the background thread, when the
+    window is created. After that the shell adds each turn as it saves it,
+    so building the next prompt's context never touches the disk.
+    """
+
+    def __init__(self, memory_dir="memory/memory_store", limit=10):
+        self._lines = deque(maxlen=limit)
+        self._seed = _background.submit(_read_memory_lines, memory_dir, limit)
+
+    def add(self, agent, input_summary, output_summary):
+        """Record a newly saved memory entry."""
+        self._seeded().append(_format_memory_line(agent, input_summary, output_summary))
+
+    def text(self):
+        """Return the window as a memory context string, oldest entry first."""
+        return "\n".join(self._seeded())
+
+    def _seeded(self):
+        if self._seed is not None:
+            try:
+                self._lines.extend(self._seed.result())
+            except Exception:
+                # Start from an empty window if the store can't be read
+                pass
+            self._seed = None
+        return self._lines
+
+
+def _format_memory_line(agent, input_summary, output_summary):
+    return f"[{agent}] {input_summary}: {output_summary}"
+
+
+def _read_memory_lines(memory_dir, limit):
+    import heapq
     import os
 
-    memory_context = []
+    lines = []
     if os.path.isdir(memory_dir):
-        for filename in sorted(os.listdir(memory_dir))[-limit:]:
+        # Filenames are timestamp-prefixed: keep only the newest `limit` entries
+        # instead of sorting the whole directory, then restore chronological order
+        with os.scandir(memory_dir) as it:
+            newest = heapq.nlargest(limit, it, key=lambda dir_entry: dir_entry.name)
+
+        for dir_entry in reversed(newest):
             try:
-                with open(os.path.join(memory_dir, filename)) as mf:
-                    entry = json.load(mf)
-                    memory_context.append(
-                        f"[{entry['agent']}] {entry['input_summary']}: {entry['output_summary']}"
+                with open(dir_entry.path, "rb") as mf:
+                    entry = loads(mf.read())
+                lines.append(
+                    _format_memory_line(
+                        entry["agent"], entry["input_summary"], entry["output_summary"]
                     )
+                )
             except Exception:
                 continue
 
-    return "\n".join(memory_context)
+    return lines
+
+
+def _persist_turn(memory, user_input, reply, task_id):
+    try:
+        memory.save(
+            agent="UX",
+            input_summary=user_input,
+            output_summary=reply,
+            task_id=task_id,
+        )
+    except Exception:
+        # Skip memory storage if it fails
+        pass
+
+    try:
+        learn_facts_batch([user_input, reply])
+    except Exception:
+        # Skip fact learning if it fails
+        pass
@@ -0,0 +1,21 @@
+# Fast JSON helpers
+# Uses orjson when it is installed and falls back to the stdlib json module
+
+import json
+from typing import Any
+
+try:
+    import orjson
+
+    def dumps(obj: Any) -> bytes:
+        """Serialize obj to compact UTF-8 JSON bytes."""
+        return orjson.dumps(obj)
+
+    loads = orjson.loads
+except ImportError:
+
+    def dumps(obj: Any) -> bytes:
+        """Serialize obj to compact UTF-8 JSON bytes."""
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+    loads = json.loads
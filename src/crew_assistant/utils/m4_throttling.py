@@ -4,28 +4,46 @@
 import subprocess
 import sys
 import time
-from typing import Optional, Tuple
+
+# Power/thermal state barely changes between polls, so probes are reused briefly
+CPU_INFO_TTL = 5.0
+_cpu_info_cache: tuple[float, dict] | None = None
 
 
 def get_cpu_info() -> dict:
     """Get current CPU performance state on macOS."""
-    try:
-        # Get current power mode
-        power_mode = subprocess.run(["pmset", "-g"], capture_output=True, text=True).stdout
+    global _cpu_info_cache
 
-        # Get thermal state
-        thermal = subprocess.run(["pmset", "-g", "therm"], capture_output=True, text=True).stdout
+    now = time.monotonic()
+    if _cpu_info_cache and now - _cpu_info_cache[0] < CPU_INFO_TTL:
+        return _cpu_info_cache[1]
+
+    try:
+        # Launch both probes before waiting on either so they run concurrently
+        power_proc = subprocess.Popen(
+            ["pmset", "-g"], stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True
+        )
+        thermal_proc = subprocess.Popen(
+            ["pmset", "-g", "therm"], stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True
+        )
+
+        # Get current power mode and thermal state
+        power_mode, _ = power_proc.communicate()
+        thermal, _ = thermal_proc.communicate()
 
         # Get current CPU stats using powermetrics (requires sudo)
         # We'll skip this for non-sudo usage
 
-        return {
+        cpu_info = {
             "power_mode": "Battery" if "Battery Power" in power_mode else "AC Power",
             "thermal_state": thermal.strip() if thermal else "Unknown",
         }
     except Exception as e:
         return {"error": str(e)}
 
+    _cpu_info_cache = (now, cpu_info)
+    return cpu_info
+
 
 def set_low_power_mode(enable: bool = True) -> bool:
     """Enable/disable Low Power Mode on macOS (requires macOS 12+)."""
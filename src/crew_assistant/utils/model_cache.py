@@ -0,0 +1,125 @@
+# Model List Cache
+# On-disk cache of provider model listings shared by the model selectors
+
+import hashlib
+import os
+import time
+from collections.abc import Callable
+from typing import Any
+
+try:
+    from .fast_json import dumps, loads
+except ImportError:
+    from fast_json import dumps, loads  # For standalone execution
+
+CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "crew-assistant")
+
+# Listings younger than this are used without contacting the server, which
+# covers relaunching within a minute; a model loaded or pulled since then
+# shows up once it expires. Older listings are refetched, or revalidated
+# with ETag/Last-Modified when the server sent either.
+DISK_CACHE_TTL = 60.0
+
+
+def get_models_json(
+    url: str, get: Callable[..., Any], timeout: Any, ttl: float = DISK_CACHE_TTL
+) -> Any:
+    """
+    Fetch a models endpoint, reusing a recent cached response.
+
+    Empty listings are never cached: a server with nothing loaded yet is
+    asked again on the next call.
+
+    Args:
+        url (str): Models endpoint URL
+        get (callable): requests.get or a Session's get
+        timeout: Request timeout passed through to get
+        ttl (float): Seconds a cached listing is used without revalidation
+
+    Returns:
+        The decoded JSON body
+
+    Raises:
+        requests.RequestException: If the server can't be reached or errors
+    """
+    path = os.path.join(
+        CACHE_DIR, hashlib.sha1(url.encode(), usedforsecurity=False).hexdigest() + ".json"
+    )
+    cached = _read_cache(path)
+
+    if cached is not None and time.time() - os.path.getmtime(path) < ttl:
+        return cached["body"]
+
+    headers = {}
+    if cached is not None:
+        if cached.get("etag"):
+            headers["If-None-Match"] = cached["etag"]
+        if cached.get("last_modified"):
+            headers["If-Modified-Since"] = cached["last_modified"]
+
+    response = get(url, headers=headers, timeout=timeout)
+    if response.status_code == 304 and cached is not None:
+        # Unchanged: restart the freshness window
+        _touch(path)
+        return cached["body"]
+
+    response.raise_for_status()
+    body = response.json()
+    if _is_empty_listing(body):
+        # Drop any older listing too so it can't be served in place of this one
+        _remove(path)
+        return body
+
+    _write_cache(
+        path,
+        {
+            "url": url,
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified"),
+            "body": body,
+        },
+    )
+    return body
+
+
+def _is_empty_listing(body: Any) -> bool:
+    # LM Studio lists models under "data", Ollama under "models"
+    return not (isinstance(body, dict) and (body.get("data") or body.get("models")))
+
+
+def _read_cache(path: str) -> dict | None:
+    try:
+        with open(path, "rb") as fh:
+            return loads(fh.read())
+    except (OSError, ValueError):
+        return None
+
+
+def _write_cache(path: str, entry: dict) -> None:
+    # Written to a temp file and renamed into place so a concurrent reader
+    # never sees a partial file. A cache that can't be written is skipped.
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        with open(tmp_path, "wb") as fh:
+            fh.write(dumps(entry))
+        os.replace(tmp_path, path)
+    except OSError:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+
+
+def _remove(path: str) -> None:
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+def _touch(path: str) -> None:
+    try:
+        os.utime(path)
+    except OSError:
+        pass
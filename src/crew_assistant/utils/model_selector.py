@@ -1,47 +1,38 @@
 # Model Selection Utility with Compatibility Checking
 # Extracted from crew_assistant/select_model.py
+#
+# Set CREW_PIN_MODEL=1 to treat OPENAI_API_MODEL as a pinned choice: select_model()
+# then returns it without fetching the model list or prompting.
 
 import os
+import sys
 
 import requests
 
+# Compatibility patterns and the pooled HTTP session are shared with the
+# multi-provider selector rather than kept as a second copy here
+try:
+    from .model_cache import get_models_json
+    from .provider_selector import (
+        CHAT_TEST_TIMEOUT,
+        MODELS_TIMEOUT,
+        categorize_model_compatibility,
+        http_session,
+    )
+except ImportError:
+    # For standalone execution
+    from model_cache import get_models_json
+    from provider_selector import (
+        CHAT_TEST_TIMEOUT,
+        MODELS_TIMEOUT,
+        categorize_model_compatibility,
+        http_session,
+    )
+
 LM_API_BASE = os.getenv("OPENAI_API_BASE", "http://localhost:1234/v1").rstrip("/")
 MODELS_ENDPOINT = f"{LM_API_BASE}/models"
 CHAT_ENDPOINT = f"{LM_API_BASE}/chat/completions"
 
-# Known compatible model patterns
-COMPATIBLE_PATTERNS = [
-    "instruct",
-    "chat",
-    "conversational",
-    "dialog",
-    "phi-3",
-    "llama-3",
-    "gemma",
-    "mistral",
-    "qwen",
-]
-
-INCOMPATIBLE_PATTERNS = ["base", "foundation", "embedding", "code-only"]
-
-
-def categorize_model_compatibility(model_id: str) -> tuple[str, str]:
-    """Categorize model compatibility based on name patterns."""
-    model_lower = model_id.lower()
-
-    # Check for known compatible patterns
-    for pattern in COMPATIBLE_PATTERNS:
-        if pattern in model_lower:
-            return "✅ Compatible", "Supports chat completion format"
-
-    # Check for known incompatible patterns
-    for pattern in INCOMPATIBLE_PATTERNS:
-        if pattern in model_lower:
-            return "❌ Incompatible", "Base model - needs fine-tuning for chat"
-
-    # Unknown - needs testing
-    return "❓ Unknown", "May need testing - try UX mode first"
-
 
 def test_model_compatibility(model_id: str = None) -> tuple[bool, str]:
     """Test if a model supports the chat completion format needed by CrewAI."""
@@ -59,7 +50,9 @@ def test_model_compatibility(model_id: str = None) -> tuple[bool, str]:
         }
 
         headers = {"Authorization": f"Bearer {os.getenv('OPENAI_API_KEY', 'not-needed')}"}
-        response = requests.post(CHAT_ENDPOINT, json=test_payload, headers=headers, timeout=10)
+        response = http_session.post(
+            CHAT_ENDPOINT, json=test_payload, headers=headers, timeout=CHAT_TEST_TIMEOUT
+        )
 
         if response.status_code == 200:
             return True, f"Model '{current_model}' is compatible with CrewAI"
@@ -79,9 +72,9 @@ def test_model_compatibility(model_id: str = None) -> tuple[bool, str]:
 def get_available_models() -> list[dict[str, str]]:
     """Get available models with compatibility information."""
     try:
-        response = requests.get(MODELS_ENDPOINT, timeout=10)
-        response.raise_for_status()
-        models_data = response.json().get("data", [])
+        models_data = get_models_json(MODELS_ENDPOINT, http_session.get, MODELS_TIMEOUT).get(
+            "data", []
+        )
 
         enhanced_models = []
         for model in models_data:
@@ -102,6 +95,12 @@ def select_model():
     Interactively select a model with compatibility information.
     Shows compatibility status and tests selected model.
     """
+    # A pinned model, or one configured where nobody can answer the prompt
+    # (no terminal), is kept and the model list is never fetched
+    configured_model = os.getenv("OPENAI_API_MODEL")
+    if configured_model and (os.getenv("CREW_PIN_MODEL") == "1" or not sys.stdin.isatty()):
+        return configured_model
+
     print("🔍 Fetching available models from LM Studio...")
     models = get_available_models()
 
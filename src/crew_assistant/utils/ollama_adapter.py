@@ -6,6 +6,14 @@ from typing import Any
 
 import requests
 
+try:
+    from .fast_json import dumps, loads
+except ImportError:
+    # For standalone execution
+    from fast_json import dumps, loads
+
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
 
 class OllamaAdapter:
     """Adapter to make Ollama API work with CrewAI's OpenAI format expectations."""
@@ -31,10 +39,15 @@ class OllamaAdapter:
         }
 
         try:
-            response = requests.post(f"{self.base_url}/api/chat", json=ollama_payload, timeout=30)
+            response = requests.post(
+                f"{self.base_url}/api/chat",
+                data=dumps(ollama_payload),
+                headers=_JSON_HEADERS,
+                timeout=30,
+            )
             response.raise_for_status()
 
-            ollama_response = response.json()
+            ollama_response = loads(response.content)
 
             # Convert Ollama response to OpenAI format
             openai_response = {
@@ -2,9 +2,18 @@
 # Supports LM Studio and Ollama backends
 
 import os
+import re
+import time
 from enum import Enum
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    from .model_cache import get_models_json
+except ImportError:
+    from model_cache import get_models_json  # For standalone execution
 
 
 class Provider(Enum):
@@ -45,6 +54,34 @@ COMPATIBLE_PATTERNS = [
 
 INCOMPATIBLE_PATTERNS = ["base", "foundation", "embedding", "code-only"]
 
+# Each pattern list compiled into one case-insensitive alternation so a model
+# id is scanned once without lowercasing a copy first
+_COMPATIBLE_RE = re.compile("|".join(map(re.escape, COMPATIBLE_PATTERNS)), re.IGNORECASE)
+_INCOMPATIBLE_RE = re.compile("|".join(map(re.escape, INCOMPATIBLE_PATTERNS)), re.IGNORECASE)
+
+# Listing and testing models talk to the same local server, so they share
+# one keep-alive connection pool instead of a new connection per request.
+# Short connect timeouts make a stopped server fail fast; reads keep the
+# 10 s allowance a busy server may need while it loads a model.
+http_session = requests.Session()
+_adapter = HTTPAdapter(
+    pool_connections=2, pool_maxsize=4, max_retries=Retry(total=2, backoff_factor=0.2)
+)
+http_session.mount("http://", _adapter)
+http_session.mount("https://", _adapter)
+MODELS_TIMEOUT = (1.0, 10.0)
+CHAT_TEST_TIMEOUT = (1.0, 10.0)
+
+# Model listings are reused for a short window so a single setup session
+# doesn't hit the models endpoint on every render/retry
+MODELS_MEMORY_CACHE_TTL = 5.0
+_models_cache: dict[tuple[Provider, str], tuple[float, list[dict]]] = {}
+
+# Compatibility probes generate real tokens, so a (provider, model, base)
+# that passed is not tested again this session. Failures are never cached:
+# the user may load the model and pick it again.
+_TEST_CACHE: dict[tuple[str, str, str], tuple[bool, str]] = {}
+
 
 def select_provider() -> Provider | None:
     """Interactive provider selection."""
@@ -91,26 +128,34 @@ def get_available_models(provider: Provider, base_url: str | None = None) -> lis
     api_base = (base_url or config["default_base"]).rstrip("/")
     models_endpoint = f"{api_base}{config['models_endpoint']}"
 
+    cache_key = (provider, api_base)
+    cached = _models_cache.get(cache_key)
+    if cached and time.monotonic() - cached[0] < MODELS_MEMORY_CACHE_TTL:
+        return cached[1]
+
     try:
-        response = requests.get(models_endpoint, timeout=10)
-        response.raise_for_status()
+        body = get_models_json(models_endpoint, http_session.get, MODELS_TIMEOUT)
 
         if provider == Provider.LM_STUDIO:
             # LM Studio uses OpenAI format
-            models_data = response.json().get("data", [])
-            return [
+            models_data = body.get("data", [])
+            models = [
                 {"id": model.get("id", "unknown"), "provider": provider.value}
                 for model in models_data
             ]
 
         elif provider == Provider.OLLAMA:
             # Ollama uses different format
-            models_data = response.json().get("models", [])
-            return [
+            models_data = body.get("models", [])
+            models = [
                 {"id": model.get("name", "unknown"), "provider": provider.value}
                 for model in models_data
             ]
 
+        if models:
+            _models_cache[cache_key] = (time.monotonic(), models)
+        return models
+
     except Exception as e:
         print(f"❌ Could not fetch models from {config['name']}: {e}")
         return []
@@ -118,17 +163,13 @@ def get_available_models(provider: Provider, base_url: str | None = None) -> lis
 
 def categorize_model_compatibility(model_id: str) -> tuple[str, str]:
     """Categorize model compatibility based on name patterns."""
-    model_lower = model_id.lower()
-
     # Check for known compatible patterns
-    for pattern in COMPATIBLE_PATTERNS:
-        if pattern in model_lower:
-            return "✅ Compatible", "Supports chat completion format"
+    if _COMPATIBLE_RE.search(model_id):
+        return "✅ Compatible", "Supports chat completion format"
 
     # Check for known incompatible patterns
-    for pattern in INCOMPATIBLE_PATTERNS:
-        if pattern in model_lower:
-            return "❌ Incompatible", "Base model - needs fine-tuning for chat"
+    if _INCOMPATIBLE_RE.search(model_id):
+        return "❌ Incompatible", "Base model - needs fine-tuning for chat"
 
     # Unknown - needs testing
     return "❓ Unknown", "May need testing - try UX mode first"
@@ -142,6 +183,10 @@ def test_model_compatibility(
     api_base = (base_url or config["default_base"]).rstrip("/")
     chat_endpoint = f"{api_base}{config['chat_endpoint']}"
 
+    cache_key = (provider.value, model_id, api_base)
+    if cache_key in _TEST_CACHE:
+        return _TEST_CACHE[cache_key]
+
     try:
         if provider == Provider.LM_STUDIO:
             # LM Studio uses OpenAI format
@@ -162,16 +207,22 @@ def test_model_compatibility(
             }
             headers = {"Content-Type": "application/json"}
 
-        response = requests.post(chat_endpoint, json=test_payload, headers=headers, timeout=10)
+        response = http_session.post(
+            chat_endpoint, json=test_payload, headers=headers, timeout=CHAT_TEST_TIMEOUT
+        )
 
         if response.status_code == 200:
-            return True, f"Model '{model_id}' is compatible with CrewAI"
+            result = True, f"Model '{model_id}' is compatible with CrewAI"
         elif response.status_code == 400:
-            return False, f"Model '{model_id}' has incompatible format"
+            result = False, f"Model '{model_id}' has incompatible format"
         elif response.status_code == 404:
-            return False, f"Model '{model_id}' not found - check if it's loaded"
+            result = False, f"Model '{model_id}' not found - check if it's loaded"
         else:
-            return False, f"Model '{model_id}' test failed: {response.status_code}"
+            result = False, f"Model '{model_id}' test failed: {response.status_code}"
+
+        if result[0]:
+            _TEST_CACHE[cache_key] = result
+        return result
 
     except requests.RequestException as e:
         return False, f"Could not connect to {config['name']}: {e}"
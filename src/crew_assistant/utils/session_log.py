@@ -0,0 +1,58 @@
+# Session Log
+# Append-only JSONL record of an interactive UX session
+
+import json
+import os
+
+
+class SessionLog:
+    """
+    Per-turn JSONL log for a chat session.
+
+    The first line holds the session metadata and every following line is one
+    chat turn. Turns are written as they happen, so a crashed session keeps
+    everything up to its last reply and nothing accumulates in memory.
+
+    Given an envelope_path, close() folds the log into a single JSON document,
+    the metadata fields plus a "chat_log" list of turns, and removes the
+    JSONL file.
+    """
+
+    def __init__(self, path: str, envelope_path: str | None = None, **metadata):
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self.path = path
+        self.envelope_path = envelope_path
+        # Line buffered: each turn reaches the file as soon as it is written
+        self._fh = open(path, "a", buffering=1, encoding="utf-8")
+        self.append(metadata)
+
+    def append(self, entry: dict) -> None:
+        """Write one record as a compact JSON line."""
+        self._fh.write(json.dumps(entry, separators=(",", ":")) + "\n")
+
+    def close(self) -> None:
+        """Close the log, folding it into the envelope file if one was requested.
+
+        Afterwards, path names the file that holds the session.
+        """
+        self._fh.close()
+        if self.envelope_path:
+            self._write_envelope()
+            os.remove(self.path)
+            self.path = self.envelope_path
+
+    def _write_envelope(self) -> None:
+        # Every line is already a serialized JSON object, so the envelope is
+        # spliced together from the raw bytes without decoding any turn
+        with open(self.path, "rb") as src, open(self.envelope_path, "wb") as dst:
+            header = src.readline().rstrip(b"\n")
+            dst.write(header[:-1])
+            dst.write(b',"chat_log":[' if header != b"{}" else b'"chat_log":[')
+
+            separator = b""
+            for line in src:
+                dst.write(separator)
+                dst.write(line.rstrip(b"\n"))
+                separator = b","
+
+            dst.write(b"]}\n")
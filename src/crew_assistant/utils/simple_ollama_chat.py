@@ -1,48 +1,300 @@
 # Simple Ollama Chat - Direct API Integration
 # Bypasses CrewAI for direct Ollama communication
 
-import json
+import asyncio
 import os
+import sys
+from collections import deque
+from collections.abc import Callable
+from contextlib import contextmanager
 
+import httpx
 import requests
+from urllib3.util.retry import Retry
+
+try:
+    from .fast_json import dumps, loads
+except ImportError:
+    # For standalone execution
+    from fast_json import dumps, loads
+
+# Generation cap per reply and the context window history has to fit into
+NUM_PREDICT = 500
+MAX_CONTEXT_TOKENS = 4096
+
+# How long Ollama keeps the model (and its cached prompt prefix) loaded
+# between requests, e.g. "30m". Unset leaves it to the server's default.
+KEEP_ALIVE = os.getenv("CREW_OLLAMA_KEEP_ALIVE")
+
+# Read size for streamed replies. Ollama sends them chunk-encoded and each
+# chunk is handed over as soon as it arrives, so a large buffer only saves
+# read calls on bursts; requests' 512-byte default splits those up
+STREAM_READ_SIZE = 64 * 1024
+
+
+def _estimate_tokens(text: str) -> int:
+    """Rough token count (~4 characters per token) without a tokenizer."""
+    return len(text) // 4 + 1
 
 
 class SimpleOllamaChat:
     """Direct Ollama chat interface."""
 
-    def __init__(self, model="mistral:latest", base_url="http://localhost:11434"):
+    def __init__(
+        self,
+        model="mistral:latest",
+        base_url="http://localhost:11434",
+        concurrency=4,
+        history_size=40,
+        max_context_tokens=MAX_CONTEXT_TOKENS,
+        connection_pool_size=4,
+        system_prompt=None,
+        keep_alive=KEEP_ALIVE,
+    ):
         self.model = model
         self.base_url = base_url.rstrip("/")
-
-    def chat(self, message: str, system_prompt: str = None) -> str:
-        """Send a chat message to Ollama and get response."""
-
+        self.concurrency = concurrency
+        self.keep_alive = keep_alive
+
+        # Sent first on every request unless a call passes its own. Keeping
+        # it and the replayed history identical from turn to turn lets
+        # Ollama reuse the already-evaluated prompt prefix.
+        self.system_prompt = system_prompt
+        # Same meaning as the providers' connection_pool_size config key
+        self.connection_pool_size = connection_pool_size
+
+        # Recent user/assistant messages replayed by chat(); the deque drops
+        # the oldest message on append once full
+        self.history: deque[dict] = deque(maxlen=history_size)
+        self._history_tokens = 0
+
+        # Older turns are also dropped once they would overflow the context
+        self.max_context_tokens = max_context_tokens
+
+        # Keep-alive session so each turn reuses the same TCP connection.
+        # Transient overload/gateway errors are retried with backoff; chat
+        # requests are safe to resend since nothing is committed server-side.
+        self._session = requests.Session()
+        self._session.headers.update({"Content-Type": "application/json"})
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=connection_pool_size,
+            pool_maxsize=connection_pool_size * 2,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.5,
+                status_forcelist=(429, 502, 503, 504),
+                allowed_methods=frozenset({"GET", "POST"}),
+                raise_on_status=False,
+            ),
+        )
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+
+        # Created on first achat() so the sync path never pays for them
+        self._async_client: httpx.AsyncClient | None = None
+        self._semaphore: asyncio.Semaphore | None = None
+        self._async_loop: asyncio.AbstractEventLoop | None = None
+
+    def _build_payload(
+        self,
+        message: str,
+        system_prompt: str = None,
+        stream: bool = False,
+        history: deque[dict] | None = None,
+    ) -> dict:
+        """Build the /api/chat request body for one turn."""
         messages = []
 
         # Add system prompt if provided
+        system_prompt = system_prompt or self.system_prompt
         if system_prompt:
             messages.append({"role": "system", "content": system_prompt})
 
+        # Replay earlier turns
+        if history:
+            messages.extend(history)
+
         # Add user message
         messages.append({"role": "user", "content": message})
 
         payload = {
             "model": self.model,
             "messages": messages,
-            "stream": False,
-            "options": {"temperature": 0.7, "num_predict": 500},
+            "stream": stream,
+            "options": {"temperature": 0.7, "num_predict": NUM_PREDICT},
         }
+        if self.keep_alive:
+            payload["keep_alive"] = self.keep_alive
+        return payload
+
+    def chat(
+        self,
+        message: str,
+        system_prompt: str = None,
+        on_token: Callable[[str], None] | None = None,
+        history_message: str | None = None,
+    ) -> str:
+        """Send a chat message to Ollama and get response.
+
+        Earlier turns from self.history are sent along and the new exchange
+        is appended to it, with history_message standing in for message
+        when given (e.g. the bare user input without per-turn context).
+        system_prompt overrides self.system_prompt for this call only. When
+        on_token is given the reply is streamed and each token is passed to
+        it as it arrives; the full text (or error) is still returned.
+        """
+        self._trim_history(
+            _estimate_tokens(message) + _estimate_tokens(system_prompt or self.system_prompt or "")
+        )
+        payload = self._build_payload(
+            message, system_prompt, stream=on_token is not None, history=self.history
+        )
+
+        try:
+            if on_token is None:
+                response = self._session.post(
+                    f"{self.base_url}/api/chat", data=dumps(payload), timeout=30
+                )
+                response.raise_for_status()
+
+                result = loads(response.content)
+                reply = result.get("message", {}).get("content", "No response")
+            else:
+                reply = self._stream_reply(payload, on_token)
+
+        except Exception as e:
+            error = f"Error: {e}"
+            if on_token is not None:
+                # Streaming callers display only what arrives through on_token
+                on_token(error)
+            return error
+
+        self._remember("user", history_message or message)
+        self._remember("assistant", reply)
+        return reply
+
+    def _remember(self, role: str, content: str) -> None:
+        """Append a message to history, keeping the running token total."""
+        if len(self.history) == self.history.maxlen:
+            self._history_tokens -= _estimate_tokens(self.history[0]["content"])
+        self.history.append({"role": role, "content": content})
+        self._history_tokens += _estimate_tokens(content)
+
+    def _trim_history(self, reserved: int) -> None:
+        """Drop the oldest turns until history fits beside the new request."""
+        budget = self.max_context_tokens - NUM_PREDICT - reserved
+        while self.history and self._history_tokens > budget:
+            self._history_tokens -= _estimate_tokens(self.history.popleft()["content"])
+
+    def _stream_reply(self, payload: dict, on_token: Callable[[str], None]) -> str:
+        """POST a streaming request and feed each token to on_token."""
+        parts = []
+        with self._session.post(
+            f"{self.base_url}/api/chat", data=dumps(payload), timeout=30, stream=True
+        ) as response:
+            response.raise_for_status()
+
+            # Ollama streams one JSON object per line
+            for line in response.iter_lines(chunk_size=STREAM_READ_SIZE):
+                if not line:
+                    continue
+                chunk = loads(line)
+                token = chunk.get("message", {}).get("content", "")
+                if token:
+                    parts.append(token)
+                    on_token(token)
+                if chunk.get("done"):
+                    break
+
+        return "".join(parts) or "No response"
+
+    async def achat(self, message: str, system_prompt: str = None) -> str:
+        """Async variant of chat() so several requests can be in flight at once.
+
+        Concurrent requests are independent, so achat() neither reads nor
+        extends self.history.
+        """
+        # The client's connections and the semaphore belong to one event
+        # loop, so a new asyncio.run() gets fresh ones
+        loop = asyncio.get_running_loop()
+        if not self._async_client or self._async_loop is not loop:
+            self._async_client = httpx.AsyncClient(
+                timeout=httpx.Timeout(30.0),
+                limits=httpx.Limits(max_keepalive_connections=self.connection_pool_size * 2),
+            )
+            self._semaphore = asyncio.Semaphore(self.concurrency)
+            self._async_loop = loop
+
+        payload = self._build_payload(message, system_prompt)
 
         try:
-            response = requests.post(f"{self.base_url}/api/chat", json=payload, timeout=30)
+            async with self._semaphore:
+                response = await self._async_client.post(
+                    f"{self.base_url}/api/chat",
+                    content=dumps(payload),
+                    headers={"Content-Type": "application/json"},
+                )
             response.raise_for_status()
 
-            result = response.json()
+            result = loads(response.content)
             return result.get("message", {}).get("content", "No response")
 
         except Exception as e:
             return f"Error: {e}"
 
+    async def achat_many(self, prompts: list[str], system_prompt: str = None) -> list[str]:
+        """Send independent prompts concurrently; replies come back in order.
+
+        At most self.concurrency requests are in flight. The server only
+        processes them in parallel if it allows it (OLLAMA_NUM_PARALLEL).
+        """
+        return await asyncio.gather(*(self.achat(prompt, system_prompt) for prompt in prompts))
+
+    def chat_many(self, prompts: list[str], system_prompt: str = None) -> list[str]:
+        """Blocking wrapper around achat_many() for synchronous callers."""
+
+        async def run() -> list[str]:
+            try:
+                return await self.achat_many(prompts, system_prompt)
+            finally:
+                await self.aclose()
+
+        return asyncio.run(run())
+
+    async def aclose(self) -> None:
+        """Close the async client if one was opened."""
+        if self._async_client:
+            await self._async_client.aclose()
+            self._async_client = None
+
+
+# Agent personality with delegation capability
+_SYSTEM_PROMPT = """You're a witty, helpful employee of the user. You talk shit, and make sure that every resource at your disposal is utilized to achieve user's (ie your) goals and objectives. You act as user's electronic butler — assisting how you can, and using your brain (all the other agents and tools in the system) to do work autonomously.
+
+When the user asks for complex tasks that require planning, development, or evaluation, respond with: "🚀 DELEGATE_TO_CREW: [task description]" to hand off to the specialized agent team.
+
+Examples of tasks to delegate:
+- Building applications or scripts
+- Project planning and implementation  
+- Code review and evaluation
+- Multi-step technical workflows
+
+For simple questions and conversations, respond normally as a helpful assistant."""
+
+# Same personality without the delegation marker, for the post-delegation fallback
+_FALLBACK_SYSTEM_PROMPT = _SYSTEM_PROMPT.replace("🚀 DELEGATE_TO_CREW:", "")
+
+_TURN_TEMPLATE = """User said: '{user_input}'
+
+Recent memory context:
+{memory_context}
+
+Respond helpfully to the user's request."""
+
+
+def _print_token(token: str) -> None:
+    print(token, end="", flush=True)
+
 
 def run_simple_ollama_ux():
     """Simple UX shell using direct Ollama integration."""
@@ -50,33 +302,42 @@ def run_simple_ollama_ux():
     import uuid
 
     from core.context_engine.memory_store import MemoryStore
-    from utils.fact_learning import build_memory_context, learn_fact_if_possible
+    from utils.fact_learning import RecentMemory, persist_turn_in_background
+    from utils.session_log import SessionLog
+    from utils.testing_config import get_testing_provider_config
 
     memory = MemoryStore()
     session_id = str(uuid.uuid4())
-    chat_log = []
 
     # Get configuration
     model = os.getenv("OPENAI_API_MODEL", "mistral:latest")
     base_url = os.getenv("OPENAI_API_BASE", "http://localhost:11434").replace("/v1", "")
 
-    chat = SimpleOllamaChat(model=model, base_url=base_url)
+    # Turns are appended to the session log as they happen and folded into
+    # a single JSON file at exit. The file name and the recorded start time
+    # come from the same clock reading, in UTC like the turns.
+    started = datetime.datetime.now(datetime.UTC)
+    log_stem = f"crew_runs/{started:%Y-%m-%dT%H-%M-%S}__ux_session__{session_id}"
+    session_log = SessionLog(
+        f"{log_stem}.jsonl",
+        envelope_path=f"{log_stem}.json",
+        session_id=session_id,
+        timestamp=started.isoformat(),
+        model=model,
+    )
+
+    chat = SimpleOllamaChat(
+        model=model,
+        base_url=base_url,
+        system_prompt=_SYSTEM_PROMPT,
+        connection_pool_size=get_testing_provider_config("ollama")["connection_pool_size"],
+    )
 
     print(f"\n🧠 Simple Ollama UX online using {model}")
     print("Type 'exit' to disengage.\n")
 
-    # Agent personality with delegation capability
-    system_prompt = """You're a witty, helpful employee of the user. You talk shit, and make sure that every resource at your disposal is utilized to achieve user's (ie your) goals and objectives. You act as user's electronic butler — assisting how you can, and using your brain (all the other agents and tools in the system) to do work autonomously.
-
-When the user asks for complex tasks that require planning, development, or evaluation, respond with: "🚀 DELEGATE_TO_CREW: [task description]" to hand off to the specialized agent team.
-
-Examples of tasks to delegate:
-- Building applications or scripts
-- Project planning and implementation  
-- Code review and evaluation
-- Multi-step technical workflows
-
-For simple questions and conversations, respond normally as a helpful assistant."""
+    # Recent memory is scanned once; each turn is added as it is saved
+    recent_memory = RecentMemory()
 
     while True:
         try:
@@ -86,23 +347,18 @@ For simple questions and conversations, respond normally as a helpful assistant.
                 break
 
             # Build context from memory
-            try:
-                memory_context = build_memory_context()
-                if not isinstance(memory_context, str):
-                    memory_context = "No recent context available"
-            except Exception:
-                memory_context = "No recent context available"
+            memory_context = recent_memory.text()
 
             # Create full prompt with context
-            full_message = f"""User said: '{user_input}'
-
-Recent memory context:
-{memory_context}
-
-Respond helpfully to the user's request."""
+            full_message = _TURN_TEMPLATE.format(
+                user_input=user_input, memory_context=memory_context
+            )
 
             print("🤖 ", end="", flush=True)
-            response = chat.chat(full_message, system_prompt)
+            # Memory context is rebuilt every turn, so only the raw input
+            # goes into the replayed history
+            response = chat.chat(full_message, on_token=_print_token, history_message=user_input)
+            print()
 
             # Check if delegation is requested
             if "🚀 DELEGATE_TO_CREW:" in response:
@@ -113,37 +369,25 @@ Respond helpfully to the user's request."""
                 try:
                     crew_result = run_ollama_crew_task(task_description, model, base_url)
                     print("\n✅ Crew completed task!")
-                    print(f"📋 Result: {crew_result}")
                     response = f"I delegated your task to the specialized crew team. Here's what they accomplished:\n\n{crew_result}"
                 except Exception as e:
                     print(f"❌ Crew delegation failed: {e}")
                     response = "I tried to delegate this to the crew, but encountered an issue. Let me try a simpler approach..."
                     response = chat.chat(
                         f"Provide a simpler response to: {user_input}",
-                        system_prompt.replace("🚀 DELEGATE_TO_CREW:", ""),
+                        _FALLBACK_SYSTEM_PROMPT,
                     )
 
-            print(response)
-
-            # Store in memory
-            try:
-                memory.store("UX", user_input, response)
-            except Exception:
-                # Skip memory storage if it fails
-                pass
+                print(response)
 
-            # Learn facts
-            try:
-                learn_fact_if_possible(user_input)
-                learn_fact_if_possible(response)
-            except Exception:
-                # Skip fact learning if it fails
-                pass
+            # Store in memory and learn facts without holding up the prompt
+            persist_turn_in_background(memory, user_input, response)
+            recent_memory.add("UX", user_input, response)
 
             # Update chat log
-            chat_log.append(
+            session_log.append(
                 {
-                    "timestamp": str(datetime.datetime.now()),
+                    "timestamp": datetime.datetime.now(datetime.UTC).isoformat(timespec="seconds"),
                     "user": user_input,
                     "assistant": response,
                 }
@@ -156,23 +400,29 @@ Respond helpfully to the user's request."""
             print(f"❌ Error: {e}")
             continue
 
-    # Save session
-    snapshot_dir = "crew_runs"
-    os.makedirs(snapshot_dir, exist_ok=True)
-    timestamp = datetime.datetime.now().strftime("%Y-%m-%dT%H-%M-%S")
-    session_file = f"{snapshot_dir}/{timestamp}__ux_session__{session_id}.json"
+    session_log.close()
+    print(f"📝 Session log saved: {session_log.path}")
 
-    session_data = {
-        "session_id": session_id,
-        "timestamp": datetime.datetime.now().isoformat(),
-        "model": model,
-        "chat_log": chat_log,
-    }
 
-    with open(session_file, "w") as f:
-        json.dump(session_data, f, indent=2)
+@contextmanager
+def _stdout_to_devnull():
+    """Point file descriptor 1 at /dev/null for the duration of the block.
 
-    print(f"📝 Session log saved: {session_file}")
+    Output is dropped by the kernel instead of being buffered in Python, and
+    writes from native code that bypass sys.stdout are silenced as well.
+    stderr is left alone so errors still show.
+    """
+    sys.stdout.flush()
+    devnull = os.open(os.devnull, os.O_WRONLY)
+    saved = os.dup(1)
+    os.dup2(devnull, 1)
+    try:
+        yield
+    finally:
+        sys.stdout.flush()
+        os.dup2(saved, 1)
+        os.close(devnull)
+        os.close(saved)
 
 
 def run_ollama_crew_task(task_description: str, model: str, base_url: str) -> str:
@@ -216,7 +466,9 @@ def run_ollama_crew_task(task_description: str, model: str, base_url: str) -> st
         verbose=False,
     )
 
-    # Create tasks
+    # Create tasks. Each step consumes the previous one's output, so they
+    # can't run concurrently; explicit context keeps each prompt to just the
+    # output it needs instead of every earlier task's output
     planner_task = Task(
         description=f"Plan this task: {task_description}",
         expected_output="A clear plan with 3-5 actionable steps",
@@ -227,12 +479,14 @@ def run_ollama_crew_task(task_description: str, model: str, base_url: str) -> st
         description="Implement the planned solution with working code and documentation",
         expected_output="Complete implementation with code, documentation, and usage instructions",
         agent=dev,
+        context=[planner_task],
     )
 
     commander_task = Task(
         description="Review the implementation and provide evaluation and next steps",
         expected_output="Technical review with recommendations and suggested next actions",
         agent=commander,
+        context=[dev_task],
     )
 
     # Execute crew workflow
@@ -242,7 +496,10 @@ def run_ollama_crew_task(task_description: str, model: str, base_url: str) -> st
         verbose=False,
     )
 
-    result = crew.kickoff()
+    # The agents are configured quiet, but CrewAI and LiteLLM still print
+    # progress; the shell shows the crew's result itself
+    with _stdout_to_devnull():
+        result = crew.kickoff()
     return str(result)
 
 
@@ -1,6 +1,7 @@
 # Testing Configuration Utilities
 # Optimize settings for testing with 8-14GB models
 
+import re
 from typing import Dict, Any, Optional
 
 try:
@@ -9,6 +10,10 @@ except ImportError:
     # For standalone execution
     from compute_throttling import set_gpu_power_limit, print_gpu_status
 
+# Embedding models and sizes too large for testing, matched anywhere in the id
+AVOID_SIZES = ["30b", "32b", "27b", "70b", "65b", "180b"]
+_UNSUITABLE_RE = re.compile("|".join(["embed", *AVOID_SIZES]), re.IGNORECASE)
+
 
 def get_testing_provider_config(provider_type: str = "lmstudio") -> Dict[str, Any]:
     """
@@ -82,13 +87,16 @@ def get_testing_inference_params() -> Dict[str, Any]:
     }
 
 
-def setup_testing_environment(gpu_throttle: bool = True, gpu_limit: int = 80) -> Dict[str, Any]:
+def setup_testing_environment(
+    gpu_throttle: bool = True, gpu_limit: int = 80, verbose: bool = False
+) -> Dict[str, Any]:
     """
     Set up optimal testing environment.
 
     Args:
         gpu_throttle: Whether to enable GPU throttling
         gpu_limit: GPU power limit percentage
+        verbose: Whether to print current GPU status (queries nvidia-smi)
 
     Returns:
         Setup status and configuration
@@ -114,7 +122,8 @@ def setup_testing_environment(gpu_throttle: bool = True, gpu_limit: int = 80) ->
             print(f"⚠️  GPU throttling failed: {e}")
 
     # Print GPU status for monitoring
-    print_gpu_status()
+    if verbose:
+        print_gpu_status()
 
     # Set up provider configurations
     setup_status["provider_configs"] = {
@@ -140,33 +149,9 @@ def is_model_suitable_for_testing(model_id: str) -> bool:
     Returns:
         True if model is good for testing
     """
-    model_lower = model_id.lower()
-
-    # Preferred sizes for testing (8-14GB range)
-    good_sizes = ["7b", "8b", "9b", "10b", "11b", "12b", "13b", "14b"]
-
-    # Avoid large models
-    avoid_sizes = ["30b", "32b", "27b", "70b", "65b", "180b"]
-
-    # Avoid embedding models
-    if "embed" in model_lower or "embedding" in model_lower:
-        return False
-
-    # Check if it's a large model to avoid
-    if any(size in model_lower for size in avoid_sizes):
-        return False
-
-    # Prefer models with good size indicators
-    if any(size in model_lower for size in good_sizes):
-        return True
-
-    # Check for tool/function capabilities
-    tool_indicators = ["instruct", "chat", "tool", "function", "agent"]
-    if any(indicator in model_lower for indicator in tool_indicators):
-        return True
-
-    # Default to suitable if no clear indicators
-    return True
+    # Preferred sizes (7b-14b) and instruct/chat/tool models are suitable, and
+    # so is anything without a clear indicator, so only exclusions matter
+    return not _UNSUITABLE_RE.search(model_id)
 
 
 def print_testing_summary(model_used: str, response_time: float, tokens_used: Optional[int] = None):
@@ -202,7 +187,7 @@ if __name__ == "__main__":
     print("🧪 Testing Configuration Utilities")
 
     # Setup testing environment
-    setup_status = setup_testing_environment(gpu_throttle=False)
+    setup_status = setup_testing_environment(gpu_throttle=False, verbose=True)
 
     print("\n" + "=" * 60)
     print("Testing environment setup complete!")
@@ -4,12 +4,27 @@
 import datetime
 import json
 import os
+import sys
 import uuid
 
-from crewai import Crew, Task
+from utils.fact_learning import RecentMemory, persist_turn_in_background
+from utils.fast_json import loads
+from utils.session_log import SessionLog
 
-from core.context_engine.memory_store import MemoryStore
-from utils.fact_learning import build_memory_context, learn_fact_if_possible
+_BORDER = "─" * 80
+
+# CrewAI's step-by-step trace costs more terminal output than the reply
+# itself on short turns, so it is opt-in
+CREW_VERBOSE = os.getenv("CREW_VERBOSE") == "1"
+
+_TASK_TEMPLATE = """
+The user said: '{user_input}'.
+
+Recent memory context:
+{memory_context}
+
+Respond as a helpful assistant. Speak clearly and helpfully.
+"""
 
 
 # Import UX agent creation function
@@ -30,7 +45,7 @@ def get_ux_agent():
             allow_delegation=False,
             use_system_prompt=False,
             llm=get_llm(),
-            verbose=True,
+            verbose=CREW_VERBOSE,
         )
     except ImportError as e:
         print(f"❌ Could not import UX agent: {e}")
@@ -72,12 +87,31 @@ def run_ux_shell(raw_mode=False):
         run_simple_ollama_ux()
         return
 
-    # Continue with CrewAI for LM Studio
+    # Piped or redirected output has no terminal to render colors, so the
+    # verbose crew trace is asked to skip the escape codes altogether
+    if not sys.stdout.isatty():
+        os.environ.setdefault("NO_COLOR", "1")
+
+    # Continue with CrewAI for LM Studio. Imported here so the Ollama path
+    # never pays for loading CrewAI.
+    from crewai import Crew, Task
+
+    from core.context_engine.memory_store import MemoryStore
+
     memory = MemoryStore()
     session_id = str(uuid.uuid4())
-    chat_log = []
-    snapshot_dir = "crew_runs"
-    os.makedirs(snapshot_dir, exist_ok=True)
+
+    # Turns are appended to the session log as they happen and folded into
+    # a single JSON file at exit
+    started = datetime.datetime.now(datetime.UTC)
+    log_stem = os.path.join("crew_runs", f"{started:%Y-%m-%dT%H-%M-%S}__ux_session__{session_id}")
+    session_log = SessionLog(
+        f"{log_stem}.jsonl",
+        envelope_path=f"{log_stem}.json",
+        session_id=session_id,
+        timestamp=started.isoformat(),
+        model=model,
+    )
 
     print(f"\n🧠 UX Shell online using {provider} with {model}")
     print("Type 'exit' to disengage.\n")
@@ -85,6 +119,9 @@ def run_ux_shell(raw_mode=False):
     # Create UX agent with current configuration
     ux = get_ux_agent()
 
+    # Recent memory is scanned once; each turn is added as it is saved
+    recent_memory = RecentMemory()
+
     while True:
         try:
             user_input = input("👤 > ").strip()
@@ -93,17 +130,12 @@ def run_ux_shell(raw_mode=False):
                 break
 
             # Build context
-            memory_context = build_memory_context()
+            memory_context = recent_memory.text()
 
             # Create task with context
-            task_description = f"""
-The user said: '{user_input}'.
-
-Recent memory context:
-{memory_context}
-
-Respond as a helpful assistant. Speak clearly and helpfully.
-"""
+            task_description = _TASK_TEMPLATE.format(
+                user_input=user_input, memory_context=memory_context
+            )
 
             ux_task = Task(
                 description=task_description,
@@ -113,12 +145,13 @@ Respond as a helpful assistant. Speak clearly and helpfully.
 
             # Run with debugging
             print("🔍 Creating crew...")
-            crew = Crew(agents=[ux], tasks=[ux_task], verbose=True)
+            crew = Crew(agents=[ux], tasks=[ux_task], verbose=CREW_VERBOSE)
 
             print("🔍 Starting inference...")
             try:
-                result = crew.kickoff()
-                print(f"🔍 Got result: {result}")
+                # The reply is read from the task output below, so the crew's
+                # own result isn't stringified or echoed here
+                crew.kickoff()
             except Exception as e:
                 print(f"❌ Error during inference: {e}")
                 import traceback
@@ -126,47 +159,44 @@ Respond as a helpful assistant. Speak clearly and helpfully.
                 traceback.print_exc()
                 continue
 
-            # Extract response
-            raw_output = getattr(ux_task.output, "content", str(ux_task.output))
-
-            try:
-                # Try to parse as JSON first
-                parsed = json.loads(raw_output)
-                if isinstance(parsed, dict):
-                    reply = parsed.get("reply", str(parsed))
-                else:
-                    reply = str(parsed)
-            except (json.JSONDecodeError, AttributeError):
-                # If not JSON, use raw output
-                reply = raw_output or "No response generated"
+            # Extract response. The output is fetched once, and only
+            # stringified when it has no content attribute.
+            task_output = ux_task.output
+            raw_output = getattr(task_output, "content", None)
+            if raw_output is None:
+                raw_output = str(task_output)
+
+            # Replies are usually plain text; only attempt a JSON parse when
+            # the output could be a JSON object or array
+            reply = raw_output or "No response generated"
+            if isinstance(raw_output, str) and raw_output.lstrip()[:1] in ("{", "["):
+                try:
+                    parsed = loads(raw_output)
+                    if isinstance(parsed, dict):
+                        reply = parsed.get("reply", str(parsed))
+                    else:
+                        reply = str(parsed)
+                except json.JSONDecodeError:
+                    pass
+
+            # One UTC timestamp per turn for both the display and the log
+            now = datetime.datetime.now(datetime.UTC)
 
             # Display response
             if raw_mode:
                 print(reply)
             else:
-                timestamp = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                border = "─" * 80
-                print(f"\n System │ {timestamp}\n{border}\n{reply}\n{border}")
+                timestamp = now.isoformat(sep=" ", timespec="seconds")
+                print(f"\n System │ {timestamp}\n{_BORDER}\n{reply}\n{_BORDER}")
 
-            # Save to memory
-            try:
-                memory.save(
-                    agent="UX",
-                    input_summary=user_input,
-                    output_summary=reply,
-                    task_id=str(ux_task.id),
-                )
-            except Exception:
-                pass
-
-            # Learn facts
-            learn_fact_if_possible(user_input)
-            learn_fact_if_possible(reply)
+            # Save to memory and learn facts without holding up the prompt
+            persist_turn_in_background(memory, user_input, reply, task_id=str(ux_task.id))
+            recent_memory.add("UX", user_input, reply)
 
             # Log session
-            chat_log.append(
+            session_log.append(
                 {
-                    "timestamp": datetime.datetime.utcnow().isoformat(),
+                    "timestamp": now.isoformat(timespec="seconds"),
                     "input": user_input,
                     "output": reply,
                 }
@@ -181,24 +211,8 @@ Respond as a helpful assistant. Speak clearly and helpfully.
 
             print(f"📍 Details: {traceback.format_exc()}")
 
-    # Save session log
-    timestamp = datetime.datetime.now(datetime.UTC).isoformat()
-    safe_ts = timestamp[:19].replace(":", "-")
-    snapshot_file = os.path.join(snapshot_dir, f"{safe_ts}__ux_session__{session_id}.json")
-
-    with open(snapshot_file, "w") as f:
-        json.dump(
-            {
-                "session_id": session_id,
-                "timestamp": timestamp,
-                "model": os.environ.get("OPENAI_API_MODEL", "unknown"),
-                "chat_log": chat_log,
-            },
-            f,
-            indent=2,
-        )
-
-    print(f"💾 Session log saved: {snapshot_file}")
+    session_log.close()
+    print(f"💾 Session log saved: {session_log.path}")
 
 
 if __name__ == "__main__":
@@ -1,14 +1,28 @@
 # Workflow Base Classes
 # Orchestration engine for multi-agent workflows
 
+import asyncio
+import re
 import time
 from abc import ABC, abstractmethod
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from enum import Enum
 from typing import Any
 
 from ..agents.base import AgentResult, BaseAgent, TaskContext
 
+# Most recent workflow results kept per workflow; stats cover every run
+HISTORY_LIMIT = 1000
+
+# Matches any "**<Name> Rating**: X/10" line so the reviewer output is
+# scanned once for all five criteria
+_RATING_RE = re.compile(
+    r"\*\*(Completeness|Quality|Clarity|Feasibility|Alignment) Rating\*\*:\s*(\d+)/10",
+    re.IGNORECASE,
+)
+
 
 class WorkflowStatus(Enum):
     """Workflow execution status."""
@@ -30,7 +44,7 @@ class ReviewDecision(Enum):
     REJECT = "REJECT"
 
 
-@dataclass
+@dataclass(slots=True)
 class WorkflowStep:
     """Individual step in workflow execution."""
 
@@ -40,9 +54,11 @@ class WorkflowStep:
     result: AgentResult | None = None
     iteration: int = 1
     max_iterations: int = 3
+    # Roles whose results this step needs; None means every earlier step
+    depends_on: list[str] | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ValidationResult:
     """Result of task specification validation."""
 
@@ -51,7 +67,7 @@ class ValidationResult:
     suggestions: list[str] | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ReviewRatings:
     """Numeric ratings from reviewer evaluation."""
 
@@ -69,7 +85,7 @@ class ReviewRatings:
         return sum(valid_ratings) / len(valid_ratings) if valid_ratings else 0.0
 
 
-@dataclass
+@dataclass(slots=True)
 class WorkflowResult:
     """Complete workflow execution result."""
 
@@ -90,11 +106,19 @@ class WorkflowResult:
 class BaseWorkflow(ABC):
     """Abstract base class for workflow orchestration."""
 
-    def __init__(self, agents: dict[str, BaseAgent], max_iterations: int = 3):
+    def __init__(
+        self, agents: dict[str, BaseAgent], max_iterations: int = 3, max_parallel: int = 4
+    ):
         """Initialize workflow with agents."""
         self.agents = agents
         self.max_iterations = max_iterations
-        self.execution_history: list[WorkflowResult] = []
+        self.max_parallel = max_parallel  # Cap on concurrently running steps
+        self.execution_history: deque[WorkflowResult] = deque(maxlen=HISTORY_LIMIT)
+        # Running totals behind stats, updated as each run is recorded
+        self._total_executions = 0
+        self._successful_executions = 0
+        self._total_iterations = 0
+        self._total_execution_time = 0.0
         self._reviewer_failure_count = 0  # Track reviewer failures across iterations
         self._current_ratings: ReviewRatings | None = None  # Store ratings from current iteration
 
@@ -109,29 +133,73 @@ class BaseWorkflow(ABC):
         pass
 
     def execute(self, user_request: str) -> WorkflowResult:
-        """Execute the complete workflow with feedback loops."""
-        start_time = time.time()
+        """Execute the complete workflow with feedback loops.
+
+        Code already running in an event loop should await execute_async()
+        instead; called from there, this runs the workflow's own loop on a
+        separate thread and blocks until it finishes.
+        """
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(self.execute_async(user_request))
+
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix="workflow") as runner:
+            return runner.submit(asyncio.run, self.execute_async(user_request)).result()
+
+    async def execute_async(self, user_request: str) -> WorkflowResult:
+        """Execute the workflow, running steps with no pending dependencies concurrently."""
+        result = await self._run(user_request)
+        self._record(result)
+        return result
+
+    def _record(self, result: WorkflowResult) -> None:
+        """Add a finished run to the history and the stats totals."""
+        self.execution_history.append(result)
+        self._total_executions += 1
+        self._successful_executions += result.success
+        self._total_iterations += result.iterations_count
+        self._total_execution_time += result.total_execution_time
+
+    async def _run(self, user_request: str) -> WorkflowResult:
+        """Run the workflow's iterations and build its result."""
+        start_time = time.perf_counter()
 
         try:
             steps = self.define_steps(user_request)
+            layers = self._step_layers(steps)
+            semaphore = asyncio.Semaphore(self.max_parallel)
             iteration = 1
 
             while iteration <= self.max_iterations:
                 print(f"🔄 Workflow iteration {iteration}")
 
-                # Execute all steps
-                step_results = []
-                for step in steps:
-                    result = self._execute_step(step, step_results, user_request)
-                    step.result = result
-                    step.iteration = iteration
-                    step_results.append(result)
+                # Execute steps layer by layer; each step sees the results of
+                # all steps finished before its layer, in definition order
+                completed: dict[int, AgentResult] = {}
+                for layer in layers:
+                    step_results = [completed[i] for i in sorted(completed)]
+                    # A failing step cancels its still-running siblings
+                    async with asyncio.TaskGroup() as tg:
+                        tasks = [
+                            tg.create_task(
+                                self._execute_step_async(
+                                    steps[i], step_results, user_request, semaphore
+                                )
+                            )
+                            for i in layer
+                        ]
+                    for i, task in zip(layer, tasks, strict=True):
+                        result = task.result()
+                        steps[i].result = result
+                        steps[i].iteration = iteration
+                        completed[i] = result
 
                 # Check if workflow should continue or terminate
                 decision = self._evaluate_workflow(steps, iteration)
 
                 if decision == WorkflowStatus.COMPLETED:
-                    execution_time = time.time() - start_time
+                    execution_time = time.perf_counter() - start_time
                     return WorkflowResult(
                         status=WorkflowStatus.COMPLETED,
                         steps=steps,
@@ -142,7 +210,7 @@ class BaseWorkflow(ABC):
                         review_ratings=self._current_ratings,
                     )
                 elif decision == WorkflowStatus.FAILED:
-                    execution_time = time.time() - start_time
+                    execution_time = time.perf_counter() - start_time
                     return WorkflowResult(
                         status=WorkflowStatus.FAILED,
                         steps=steps,
@@ -157,7 +225,7 @@ class BaseWorkflow(ABC):
                 print(f"🔄 Iteration {iteration - 1} requires revision, continuing...")
 
             # Max iterations reached
-            execution_time = time.time() - start_time
+            execution_time = time.perf_counter() - start_time
             return WorkflowResult(
                 status=WorkflowStatus.FAILED,
                 steps=steps,
@@ -169,7 +237,13 @@ class BaseWorkflow(ABC):
             )
 
         except Exception as e:
-            execution_time = time.time() - start_time
+            if isinstance(e, ExceptionGroup):
+                # Report the step failure itself rather than the TaskGroup wrapper
+                e = e.exceptions[0]
+            error = str(e)
+            if isinstance(e, TimeoutError):
+                error = "step exceeded its agent's max_execution_time"
+            execution_time = time.perf_counter() - start_time
             return WorkflowResult(
                 status=WorkflowStatus.FAILED,
                 steps=[],
@@ -177,13 +251,64 @@ class BaseWorkflow(ABC):
                 total_execution_time=execution_time,
                 iterations_count=1,
                 success=False,
-                error_message=f"Workflow execution error: {str(e)}",
+                error_message=f"Workflow execution error: {error}",
             )
 
-    def _execute_step(
-        self, step: WorkflowStep, previous_results: list[AgentResult], user_request: str
+    @staticmethod
+    def _step_layers(steps: list[WorkflowStep]) -> list[list[int]]:
+        """Group step indices into layers whose dependencies all sit in earlier layers."""
+        pending = list(range(len(steps)))
+        done_roles: set[str] = set()
+        layers = []
+
+        while pending:
+            ready = []
+            for i in pending:
+                depends_on = steps[i].depends_on
+                if depends_on is None:
+                    depends_on = [step.agent_role for step in steps[:i]]
+                if all(role in done_roles for role in depends_on):
+                    ready.append(i)
+
+            if not ready:
+                roles = [steps[i].agent_role for i in pending]
+                raise ValueError(f"Unresolvable step dependencies for: {roles}")
+
+            layers.append(ready)
+            done_roles.update(steps[i].agent_role for i in ready)
+            pending = [i for i in pending if i not in ready]
+
+        return layers
+
+    async def _execute_step_async(
+        self,
+        step: WorkflowStep,
+        previous_results: list[AgentResult],
+        user_request: str,
+        semaphore: asyncio.Semaphore,
     ) -> AgentResult:
-        """Execute a single workflow step."""
+        """Run a step, bounded by the workflow's parallelism cap.
+
+        Agents with a native execute_task_async() are awaited directly and
+        cancelled once they exceed the agent's max_execution_time. Other
+        agents run execute_task() on a worker thread without a time limit:
+        the thread can't be interrupted, and asyncio.run() joins it before
+        execute() returns anyway.
+        """
+        agent, context = self._prepare_step(step, previous_results, user_request)
+
+        async with semaphore:
+            execute_async = getattr(agent, "execute_task_async", None)
+            if execute_async and getattr(agent, "native_async", True):
+                timeout = getattr(getattr(agent, "config", None), "max_execution_time", None)
+                async with asyncio.timeout(timeout):
+                    return await execute_async(context)
+            return await asyncio.to_thread(agent.execute_task, context)
+
+    def _prepare_step(
+        self, step: WorkflowStep, previous_results: list[AgentResult], user_request: str
+    ) -> tuple[BaseAgent, TaskContext]:
+        """Look up the step's agent and build its task context."""
         agent = self.agents.get(step.agent_role)
         if not agent:
             raise ValueError(f"Agent '{step.agent_role}' not found")
@@ -192,11 +317,7 @@ class BaseWorkflow(ABC):
         context.user_input = user_request
 
         print(f"🤖 Executing {step.agent_role}...")
-        result = agent.execute_task(context)
-
-        # With numeric ratings system, reviewer failures don't block workflow
-        # Just return the actual result (success or failure) for analytics
-        return result
+        return agent, context
 
     def _evaluate_workflow(self, steps: list[WorkflowStep], iteration: int) -> WorkflowStatus:
         """Evaluate workflow and collect quality ratings. Always returns COMPLETED for non-blocking execution."""
@@ -219,29 +340,20 @@ class BaseWorkflow(ABC):
 
     def _parse_numeric_ratings(self, review_content: str) -> ReviewRatings:
         """Parse numeric ratings (1-10 scale) from reviewer output using regex patterns."""
-        import re
-
         ratings = ReviewRatings()
+        seen = set()
 
-        # Pattern to match "**Rating Name**: X/10" format
-        rating_patterns = {
-            "completeness": r"\*\*Completeness Rating\*\*:\s*(\d+)/10",
-            "quality": r"\*\*Quality Rating\*\*:\s*(\d+)/10",
-            "clarity": r"\*\*Clarity Rating\*\*:\s*(\d+)/10",
-            "feasibility": r"\*\*Feasibility Rating\*\*:\s*(\d+)/10",
-            "alignment": r"\*\*Alignment Rating\*\*:\s*(\d+)/10",
-        }
+        for match in _RATING_RE.finditer(review_content):
+            field_name = match.group(1).lower()
+            # Only the first rating given for each criterion counts
+            if field_name in seen:
+                continue
+            seen.add(field_name)
 
-        for field_name, pattern in rating_patterns.items():
-            match = re.search(pattern, review_content, re.IGNORECASE)
-            if match:
-                try:
-                    rating_value = int(match.group(1))
-                    # Validate rating is in 1-10 range
-                    if 1 <= rating_value <= 10:
-                        setattr(ratings, field_name, rating_value)
-                except (ValueError, IndexError):
-                    pass  # Keep default value of 0 for invalid ratings
+            rating_value = int(match.group(2))
+            # Validate rating is in 1-10 range; keep default value of 0 otherwise
+            if 1 <= rating_value <= 10:
+                setattr(ratings, field_name, rating_value)
 
         return ratings
 
@@ -258,18 +370,10 @@ class BaseWorkflow(ABC):
     @property
     def stats(self) -> dict[str, Any]:
         """Get workflow execution statistics."""
+        runs = self._total_executions
         return {
-            "total_executions": len(self.execution_history),
-            "success_rate": sum(1 for r in self.execution_history if r.success)
-            / len(self.execution_history)
-            if self.execution_history
-            else 0,
-            "average_iterations": sum(r.iterations_count for r in self.execution_history)
-            / len(self.execution_history)
-            if self.execution_history
-            else 0,
-            "average_execution_time": sum(r.total_execution_time for r in self.execution_history)
-            / len(self.execution_history)
-            if self.execution_history
-            else 0,
+            "total_executions": runs,
+            "success_rate": self._successful_executions / runs if runs else 0,
+            "average_iterations": self._total_iterations / runs if runs else 0,
+            "average_execution_time": self._total_execution_time / runs if runs else 0,
         }
@@ -6,6 +6,118 @@ from ..agents.base import AgentResult, BaseAgent
 
 from .base import BaseWorkflow, TaskContext, WorkflowStep
 
+# Prompt scaffolding for each step, filled in once per build_context() call
+_PLANNER_TEMPLATE = """Create a detailed implementation plan based on this research:
+
+RESEARCH FINDINGS:
+{research}
+
+PLANNING TASK:
+{task}
+
+Provide a clear, actionable plan that the development team can follow."""
+
+_DEVELOPER_TEMPLATE = """Implement the solution based on this research and plan:
+
+RESEARCH FINDINGS:
+{research}
+
+IMPLEMENTATION PLAN:
+{plan}
+
+DEVELOPMENT TASK:
+{task}
+
+Create a complete, working implementation that follows the research recommendations and plan."""
+
+_REVIEWER_TEMPLATE = """Review and validate this complete deliverable:
+
+ORIGINAL REQUIREMENTS:
+{requirements}
+
+RESEARCH FINDINGS SUMMARY:
+{research}
+
+IMPLEMENTATION PLAN SUMMARY:
+{plan}
+
+DEVELOPER DELIVERABLE:
+{deliverable}
+
+REVIEW TASK:
+{task}
+
+Note: Research and plan sections may be truncated. Focus primarily on validating the Developer deliverable meets the original requirements.
+
+Provide numeric ratings (1-10) for each evaluation criteria listed in your system prompt."""
+
+_FINAL_OUTPUT_TEMPLATE = """# ✅ Completed Project Deliverable
+
+{deliverable}
+
+---
+## 🔍 Quality Assessment
+{assessment}
+
+---
+*Generated by enhanced 4-agent crew workflow*
+*Research → Plan → Develop → Review with numeric quality ratings*"""
+
+# Limit reviewer context size to prevent token overflow
+_REVIEW_SECTION_MAX_CHARS = 2000
+
+
+def _truncate_content(content: str, max_chars: int) -> str:
+    if len(content) <= max_chars:
+        return content
+    return content[:max_chars] + "\n... [truncated for review]"
+
+
+def _describe_planner_task(
+    step: WorkflowStep, previous_results: list[AgentResult], context: TaskContext
+) -> str | None:
+    # Planner gets research findings
+    if not previous_results:
+        return None
+    return _PLANNER_TEMPLATE.format(
+        research=previous_results[0].content, task=step.task_description
+    )
+
+
+def _describe_developer_task(
+    step: WorkflowStep, previous_results: list[AgentResult], context: TaskContext
+) -> str | None:
+    # Developer gets both research and plan
+    if len(previous_results) < 2:
+        return None
+    return _DEVELOPER_TEMPLATE.format(
+        research=previous_results[0].content,
+        plan=previous_results[1].content,
+        task=step.task_description,
+    )
+
+
+def _describe_reviewer_task(
+    step: WorkflowStep, previous_results: list[AgentResult], context: TaskContext
+) -> str | None:
+    # Reviewer gets everything for validation - but with size limits
+    if len(previous_results) < 3:
+        return None
+    return _REVIEWER_TEMPLATE.format(
+        requirements=context.user_input,
+        research=_truncate_content(previous_results[0].content, _REVIEW_SECTION_MAX_CHARS),
+        plan=_truncate_content(previous_results[1].content, _REVIEW_SECTION_MAX_CHARS),
+        deliverable=previous_results[2].content,
+        task=step.task_description,
+    )
+
+
+_TASK_DESCRIBERS = {
+    "Planner": _describe_planner_task,
+    "Developer": _describe_developer_task,
+    "Reviewer": _describe_reviewer_task,
+}
+
 
 class SequentialWorkflow(BaseWorkflow):
     """Sequential workflow: UX → Planner → Developer → Reviewer with quality gates."""
@@ -28,21 +140,25 @@ class SequentialWorkflow(BaseWorkflow):
                 agent_role="UX",
                 task_description=f"Analyze user experience aspects of: {user_request}",
                 expected_output="User experience analysis with requirements, user needs, and interaction patterns",
+                depends_on=[],
             ),
             WorkflowStep(
                 agent_role="Planner",
                 task_description="Create detailed implementation plan based on research findings",
                 expected_output="Step-by-step implementation plan with clear tasks and dependencies",
+                depends_on=["UX"],
             ),
             WorkflowStep(
                 agent_role="Developer",
                 task_description="Implement the solution according to the research and plan",
                 expected_output="Complete working implementation with code, documentation, and usage instructions",
+                depends_on=["UX", "Planner"],
             ),
             WorkflowStep(
                 agent_role="Reviewer",
                 task_description="Review and validate the complete deliverable against requirements",
                 expected_output="Quality assessment with numeric ratings (1-10) for completeness, quality, clarity, feasibility, and alignment",
+                depends_on=["UX", "Planner", "Developer"],
             ),
         ]
 
@@ -54,78 +170,12 @@ class SequentialWorkflow(BaseWorkflow):
             previous_results=[result.content for result in previous_results if result.success],
         )
 
-        # Add role-specific context
-        if step.agent_role == "Researcher":
-            # Researcher gets the raw user request
-            pass
-
-        elif step.agent_role == "Planner":
-            # Planner gets research findings
-            if previous_results:
-                research_result = previous_results[0]  # Researcher is first
-                context.task_description = f"""Create a detailed implementation plan based on this research:
-
-RESEARCH FINDINGS:
-{research_result.content}
-
-PLANNING TASK:
-{step.task_description}
-
-Provide a clear, actionable plan that the development team can follow."""
-
-        elif step.agent_role == "Developer":
-            # Developer gets both research and plan
-            if len(previous_results) >= 2:
-                research_result = previous_results[0]
-                plan_result = previous_results[1]
-                context.task_description = f"""Implement the solution based on this research and plan:
-
-RESEARCH FINDINGS:
-{research_result.content}
-
-IMPLEMENTATION PLAN:
-{plan_result.content}
-
-DEVELOPMENT TASK:
-{step.task_description}
-
-Create a complete, working implementation that follows the research recommendations and plan."""
-
-        elif step.agent_role == "Reviewer":
-            # Reviewer gets everything for validation - but with size limits
-            if len(previous_results) >= 3:
-                research_result = previous_results[0]
-                plan_result = previous_results[1]
-                dev_result = previous_results[2]
-
-                # Limit context size to prevent token overflow
-                max_chars_per_section = 2000
-
-                def truncate_content(content: str, max_chars: int) -> str:
-                    if len(content) <= max_chars:
-                        return content
-                    return content[:max_chars] + "\n... [truncated for review]"
-
-                context.task_description = f"""Review and validate this complete deliverable:
-
-ORIGINAL REQUIREMENTS:
-{context.user_input}
-
-RESEARCH FINDINGS SUMMARY:
-{truncate_content(research_result.content, max_chars_per_section)}
-
-IMPLEMENTATION PLAN SUMMARY:
-{truncate_content(plan_result.content, max_chars_per_section)}
-
-DEVELOPER DELIVERABLE:
-{dev_result.content}
-
-REVIEW TASK:
-{step.task_description}
-
-Note: Research and plan sections may be truncated. Focus primarily on validating the Developer deliverable meets the original requirements.
-
-Provide numeric ratings (1-10) for each evaluation criteria listed in your system prompt."""
+        # Add role-specific context; the first step gets the raw user request
+        describe = _TASK_DESCRIBERS.get(step.agent_role)
+        if describe:
+            description = describe(step, previous_results, context)
+            if description:
+                context.task_description = description
 
         return context
 
@@ -140,31 +190,15 @@ Provide numeric ratings (1-10) for each evaluation criteria listed in your syste
         )
 
         if dev_step and dev_step.result:
-            output = f"""# ✅ Completed Project Deliverable
-
-{dev_step.result.content}
-
----
-"""
-
             # Add quality ratings if available
             if reviewer_step and reviewer_step.result and reviewer_step.result.success:
-                output += f"""## 🔍 Quality Assessment
-{reviewer_step.result.content}
-
----
-"""
+                assessment = reviewer_step.result.content
             else:
-                output += """## 🔍 Quality Assessment
-Quality ratings unavailable due to reviewer failure.
-
----
-"""
-
-            output += """*Generated by enhanced 4-agent crew workflow*
-*Research → Plan → Develop → Review with numeric quality ratings*"""
+                assessment = "Quality ratings unavailable due to reviewer failure."
 
-            return output
+            return _FINAL_OUTPUT_TEMPLATE.format(
+                deliverable=dev_step.result.content, assessment=assessment
+            )
 
         # Fallback to standard compilation
         return super()._compile_final_output(steps)
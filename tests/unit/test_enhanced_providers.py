@@ -180,6 +180,35 @@ class TestBaseProvider:
         provider.clear_cache()
         assert len(provider._response_cache) == 0
 
+    def test_list_models_cached(self):
+        """Test model listings are reused within the TTL window."""
+        provider = self.create_test_provider({"models_cache_ttl": 60})
+
+        with patch.object(provider, "list_models", wraps=provider.list_models) as list_models:
+            first = provider.list_models_cached()
+            second = provider.list_models_cached()
+            assert first is second
+            assert list_models.call_count == 1
+
+            # Clearing the cache forces a fresh listing
+            provider.clear_cache()
+            provider.list_models_cached()
+            assert list_models.call_count == 2
+
+            # Expired listings are refetched
+            provider._models_cache = (time.monotonic() - 120, first)
+            provider.list_models_cached()
+            assert list_models.call_count == 3
+
+    def test_async_client_closed_with_its_loop(self):
+        """Each event loop's async client is closed before that loop shuts down."""
+        provider = self.create_test_provider()
+        clients = [AsyncMock(), AsyncMock()]
+
+        for client in clients:
+            asyncio.run(provider._close_with_running_loop(client))
+            client.aclose.assert_awaited_once()
+
     @pytest.mark.asyncio
     async def test_async_methods(self):
         """Test async method implementations."""
@@ -0,0 +1,52 @@
+# Session Log Tests
+# JSONL turn logging and the JSON envelope written at close
+
+import json
+
+from crew_assistant.utils.session_log import SessionLog
+
+
+class TestSessionLog:
+    """Test SessionLog persistence."""
+
+    def test_turns_are_written_as_they_happen(self, tmp_path):
+        """Metadata and each turn land on their own line before close()."""
+        log = SessionLog(str(tmp_path / "runs" / "session.jsonl"), session_id="abc")
+        log.append({"user": "hi", "output": "hello"})
+
+        lines = (tmp_path / "runs" / "session.jsonl").read_text().splitlines()
+        assert [json.loads(line) for line in lines] == [
+            {"session_id": "abc"},
+            {"user": "hi", "output": "hello"},
+        ]
+        log.close()
+
+    def test_close_writes_envelope(self, tmp_path):
+        """close() folds the log into one JSON document and removes the JSONL file."""
+        jsonl_path = tmp_path / "session.jsonl"
+        envelope_path = tmp_path / "session.json"
+        log = SessionLog(
+            str(jsonl_path), envelope_path=str(envelope_path), session_id="abc", model="m"
+        )
+        log.append({"user": "hi", "output": "hello"})
+        log.append({"user": 'naïve "quote"', "output": "line\nbreak"})
+        log.close()
+
+        assert not jsonl_path.exists()
+        assert log.path == str(envelope_path)
+        assert json.loads(envelope_path.read_text()) == {
+            "session_id": "abc",
+            "model": "m",
+            "chat_log": [
+                {"user": "hi", "output": "hello"},
+                {"user": 'naïve "quote"', "output": "line\nbreak"},
+            ],
+        }
+
+    def test_envelope_without_metadata_or_turns(self, tmp_path):
+        """An empty session still produces a valid envelope."""
+        envelope_path = tmp_path / "session.json"
+        log = SessionLog(str(tmp_path / "session.jsonl"), envelope_path=str(envelope_path))
+        log.close()
+
+        assert json.loads(envelope_path.read_text()) == {"chat_log": []}
@@ -0,0 +1,47 @@
+# Summary Queue Tests
+# Streamed agent output and batch flushing
+
+import json
+
+import pytest
+
+from crew_assistant.core.context_engine import summary_queue
+from crew_assistant.core.context_engine.summary_queue import SummaryQueue
+
+
+@pytest.fixture
+def queue_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(summary_queue, "SUMMARY_QUEUE_DIR", str(tmp_path))
+    return tmp_path
+
+
+class TestSummaryQueue:
+    """Test SummaryQueue streaming and flushing."""
+
+    def test_streamed_chunks_become_one_entry(self, queue_dir):
+        """Chunks for one (source, task_id) are queued together by end_chunks()."""
+        queue = SummaryQueue(flush_limit=10)
+        for line in ["first line\n", "second line\n"]:
+            queue.append_chunk("DevAgent", "task-1", line)
+        queue.append_chunk("Reviewer", "task-1", "separate stream\n")
+
+        queue.end_chunks("DevAgent", "task-1")
+
+        assert queue.pending() == 1
+        entry = queue.queue[0]
+        assert entry["source"] == "DevAgent"
+        assert entry["content"] == "first line\nsecond line"
+        assert entry["metadata"] == {"task_id": "task-1"}
+
+    def test_flush_writes_open_streams(self, queue_dir):
+        """flush() includes streams that were never ended."""
+        queue = SummaryQueue(flush_limit=10)
+        queue.add("done", "Planner")
+        queue.append_chunk("DevAgent", "task-2", "partial output")
+
+        queue.flush()
+
+        [batch] = queue_dir.iterdir()
+        entries = [json.loads(line) for line in batch.read_text().splitlines()]
+        assert [e["content"] for e in entries] == ["done", "partial output"]
+        assert queue.pending() == 0
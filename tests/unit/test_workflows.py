@@ -0,0 +1,183 @@
+# Workflow Orchestration Tests
+# Step scheduling and result bookkeeping for BaseWorkflow
+
+import asyncio
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from crew_assistant.agents.base import AgentResult, TaskContext
+from crew_assistant.workflows.base import BaseWorkflow, WorkflowStatus, WorkflowStep
+
+
+class RecordingAgent:
+    """Agent stand-in that records the context it was given."""
+
+    def __init__(self, role, barrier=None):
+        self.role = role
+        self.barrier = barrier
+        self.contexts = []
+
+    def execute_task(self, context):
+        self.contexts.append(context)
+        if self.barrier:
+            # Only passes if every party of the barrier runs at the same time
+            self.barrier.wait(timeout=5)
+        return AgentResult(content=f"{self.role} output", agent_role=self.role, execution_time=0.0)
+
+
+class AsyncRecordingAgent(RecordingAgent):
+    """Agent stand-in with a native async entry point."""
+
+    async def execute_task_async(self, context):
+        self.contexts.append(context)
+        return AgentResult(content=f"{self.role} async", agent_role=self.role, execution_time=0.0)
+
+
+class SlowAgent(RecordingAgent):
+    """Agent stand-in that outlasts its own max_execution_time."""
+
+    config = SimpleNamespace(max_execution_time=0.05)
+
+    def execute_task(self, context):
+        time.sleep(0.2)
+        return super().execute_task(context)
+
+
+class SlowAsyncAgent(SlowAgent):
+    """Native async variant of SlowAgent."""
+
+    async def execute_task_async(self, context):
+        await asyncio.sleep(5)
+
+
+class FanOutWorkflow(BaseWorkflow):
+    """A → (B, C) → D."""
+
+    def define_steps(self, user_request):
+        return [
+            WorkflowStep("A", "a", "a", depends_on=[]),
+            WorkflowStep("B", "b", "b", depends_on=["A"]),
+            WorkflowStep("C", "c", "c", depends_on=["A"]),
+            WorkflowStep("D", "d", "d", depends_on=["B", "C"]),
+        ]
+
+    def build_context(self, step, previous_results):
+        return TaskContext(
+            task_description=step.task_description,
+            expected_output=step.expected_output,
+            previous_results=[result.content for result in previous_results],
+        )
+
+
+class TestWorkflowScheduling:
+    """Test dependency-driven step execution."""
+
+    def test_step_layers(self):
+        """Independent steps share a layer; steps without depends_on stay sequential."""
+        steps = FanOutWorkflow({}).define_steps("")
+        assert BaseWorkflow._step_layers(steps) == [[0], [1, 2], [3]]
+
+        sequential = [WorkflowStep(role, role, role) for role in ("A", "B", "C")]
+        assert BaseWorkflow._step_layers(sequential) == [[0], [1], [2]]
+
+    def test_unresolvable_dependencies(self):
+        """A dependency on an unknown role is reported instead of hanging."""
+        steps = [WorkflowStep("A", "a", "a", depends_on=["Missing"])]
+        with pytest.raises(ValueError):
+            BaseWorkflow._step_layers(steps)
+
+    def test_independent_steps_run_concurrently(self):
+        """Sibling steps run at the same time and later steps see results in step order."""
+        barrier = threading.Barrier(2)
+        agents = {
+            "A": RecordingAgent("A"),
+            "B": RecordingAgent("B", barrier),
+            "C": RecordingAgent("C", barrier),
+            "D": RecordingAgent("D"),
+        }
+
+        result = FanOutWorkflow(agents, max_iterations=1).execute("request")
+
+        assert result.status == WorkflowStatus.COMPLETED
+        assert [step.result.content for step in result.steps] == [
+            "A output",
+            "B output",
+            "C output",
+            "D output",
+        ]
+        assert agents["B"].contexts[0].previous_results == ["A output"]
+        assert agents["D"].contexts[0].previous_results == ["A output", "B output", "C output"]
+
+    def test_failing_step_fails_workflow(self):
+        """A step error surfaces as a failed workflow and later steps never run."""
+        agents = {role: RecordingAgent(role) for role in ("A", "B", "D")}
+
+        result = FanOutWorkflow(agents, max_iterations=1).execute("request")
+
+        assert result.status == WorkflowStatus.FAILED
+        assert "Agent 'C' not found" in result.error_message
+        assert agents["D"].contexts == []
+
+    def test_native_async_agents_are_awaited(self):
+        """Agents with execute_task_async() skip the worker thread."""
+        agents = {role: AsyncRecordingAgent(role) for role in ("A", "B", "C", "D")}
+
+        result = FanOutWorkflow(agents, max_iterations=1).execute("request")
+
+        assert result.status == WorkflowStatus.COMPLETED
+        assert [step.result.content for step in result.steps] == [
+            "A async",
+            "B async",
+            "C async",
+            "D async",
+        ]
+
+    def test_thread_steps_run_to_completion(self):
+        """max_execution_time doesn't discard the result of a worker-thread step."""
+        agents = {role: SlowAgent(role) for role in ("A", "B", "C", "D")}
+
+        result = FanOutWorkflow(agents, max_iterations=1).execute("request")
+
+        assert result.status == WorkflowStatus.COMPLETED
+        assert result.steps[-1].result.content == "D output"
+
+    def test_native_async_steps_time_out(self):
+        """A native async step is cancelled once it exceeds max_execution_time."""
+        agents = {role: SlowAsyncAgent(role) for role in ("A", "B", "C", "D")}
+
+        start = time.perf_counter()
+        result = FanOutWorkflow(agents, max_iterations=1).execute("request")
+
+        assert time.perf_counter() - start < 1
+        assert result.status == WorkflowStatus.FAILED
+        assert "max_execution_time" in result.error_message
+
+    def test_execute_inside_running_loop(self):
+        """execute() still works when the caller already has an event loop running."""
+        agents = {role: AsyncRecordingAgent(role) for role in ("A", "B", "C", "D")}
+        workflow = FanOutWorkflow(agents, max_iterations=1)
+
+        async def main():
+            return workflow.execute("request")
+
+        result = asyncio.run(main())
+
+        assert result.status == WorkflowStatus.COMPLETED
+        assert result.steps[-1].result.content == "D async"
+
+    def test_stats_track_recorded_runs(self):
+        """Each run lands in execution_history and the running stats."""
+        agents = {role: RecordingAgent(role) for role in ("A", "B", "C", "D")}
+        workflow = FanOutWorkflow(agents, max_iterations=1)
+
+        workflow.execute("first")
+        del agents["D"]
+        workflow.execute("second")
+
+        assert len(workflow.execution_history) == 2
+        assert workflow.stats["total_executions"] == 2
+        assert workflow.stats["success_rate"] == 0.5
+        assert workflow.stats["average_iterations"] == 1